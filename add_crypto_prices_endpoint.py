@@ -14,7 +14,8 @@ async function getCryptoPrices(symbols = ['bitcoin', 'ethereum', 'cardano', 'pol
     try {
       // Fetch real prices from CoinGecko API
       const ids = symbols.join(',');
-      const response = await axios.get(`https://api.coingecko.com/api/v3/simple/price`, {
+      const baseUrl = process.env.COINGECKO_API_URL || 'https://api.coingecko.com/api/v3';
+      const response = await axios.get(`${baseUrl}/simple/price`, {
         params: {
           ids: ids,
           vs_currencies: 'usd',
@@ -24,24 +25,13 @@ async function getCryptoPrices(symbols = ['bitcoin', 'ethereum', 'cardano', 'pol
         timeout: 5000
       });
       
-      // Transform to our format
+      // Transform to our format (symbols come from the shared registry)
       const prices = {};
-      const symbolMap = {
-        'bitcoin': 'BTC',
-        'ethereum': 'ETH',
-        'cardano': 'ADA',
-        'polkadot': 'DOT',
-        'chainlink': 'LINK',
-        'ripple': 'XRP',
-        'solana': 'SOL',
-        'avalanche-2': 'AVAX'
-      };
-      
       for (const [id, data] of Object.entries(response.data)) {
-        const symbol = symbolMap[id] || id.toUpperCase().substring(0, 3);
+        const symbol = coinIdToSymbol(id);
         prices[symbol] = {
           symbol: symbol,
-          name: id.charAt(0).toUpperCase() + id.slice(1),
+          name: coinName(id),
           current_price: data.usd || 0,
           price_change_percentage_24h: data.usd_24h_change || 0,
           market_cap: data.usd_market_cap || 0
@@ -61,6 +51,12 @@ async function getCryptoPrices(symbols = ['bitcoin', 'ethereum', 'cardano', 'pol
 # Replace the marker
 content = content.replace(marker, new_endpoint)
 
+# Load the shared symbol registry once at startup (see build_symbol_registry.py)
+registry_require = "const { symbolToCoinId, coinIdToSymbol, coinName } = require('./utils/symbolRegistry');"
+registry_anchor = "const { logger } = require('./utils/logMasking');"
+if registry_require not in content:
+    content = content.replace(registry_anchor, registry_anchor + '\n' + registry_require, 1)
+
 # Write back
 with open('server-real-v3.js', 'w', encoding='utf-8') as f:
     f.write(content)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# Fan-out aggregator for /api/dashboard/comprehensive
+#
+# The patched front end calls /api/dashboard/comprehensive for the portfolio
+# summary, market overview and performance fallback, but the server only has
+# the separate *-real routes. This adds the aggregator route after
+# comprehensive-real. Sections are loaded concurrently through
+# utils/sectionAggregator.js, each with its own TTL cache:
+#
+#   portfolio    30s, per user  (v_dashboard_portfolio, as portfolio-real)
+#   market       60s, shared    (getMarketOverview)
+#   performance  60s, per user  (daily portfolio_snapshots, last 30 days)
+#
+# `?sections=portfolio,market` selects a subset. A section that is slower
+# than DASHBOARD_SECTION_TIMEOUT_MS (default 1500) is returned as null with
+# status 'timeout' (or its expired value as 'stale') in meta.sections, instead
+# of holding up the whole response.
+#
+# The widgets are also switched to request only the section they render;
+# the performance chart reads the 'performance' section first and falls back
+# to a curve synthesised from the 'portfolio' totals when it is empty.
+#
+# Usage:
+#   python3 add_dashboard_aggregator.py   # exits 1 if an anchor is missing
+import re
+import sys
+
+SERVER_FILE = 'server-real-v3.js'
+APP_FILE = 'public/static/app.js'
+
+AGGREGATOR_REQUIRE = "const { createSectionAggregator } = require('./utils/sectionAggregator');\n"
+
+AGGREGATOR_ROUTE = '''
+// Comprehensive Dashboard - fan-out aggregator with per-section caching
+const dashboardSections = createSectionAggregator({
+  portfolio: {
+    ttlMs: 30000,
+    perUser: true,
+    load: async ({ userId }) => {
+      const result = await pool.query(
+        'SELECT * FROM v_dashboard_portfolio WHERE user_id = $1',
+        [userId]
+      );
+      const p = result.rows[0] || {};
+      return {
+        totalBalance: parseFloat(p.total_balance) || 0,
+        availableBalance: parseFloat(p.available_balance) || 0,
+        totalPnL: parseFloat(p.total_pnl) || 0,
+        avgPnLPercentage: parseFloat(p.avg_pnl_percentage) || 0,
+        dailyChange: parseFloat(p.daily_pnl) || 0,
+        weeklyChange: 0,
+        monthlyChange: 0
+      };
+    }
+  },
+  market: {
+    ttlMs: 60000,
+    load: () => getMarketOverview()
+  },
+  performance: {
+    ttlMs: 60000,
+    perUser: true,
+    load: async ({ userId }) => {
+      const result = await pool.query(`
+        SELECT
+          DATE_TRUNC('day', created_at) as day,
+          AVG(total_balance) as avg_balance
+        FROM portfolio_snapshots
+        WHERE user_id = $1
+          AND created_at >= NOW() - INTERVAL '30 days'
+        GROUP BY day
+        ORDER BY day
+      `, [userId]);
+
+      const first = parseFloat(result.rows[0]?.avg_balance) || 0;
+      return {
+        history: result.rows.map(r => {
+          const balance = parseFloat(r.avg_balance) || 0;
+          return {
+            date: new Date(r.day).toLocaleDateString('fa-IR'),
+            balance,
+            pnl: parseFloat((balance - first).toFixed(2))
+          };
+        })
+      };
+    }
+  }
+}, {
+  timeoutMs: parseInt(process.env.DASHBOARD_SECTION_TIMEOUT_MS) || 1500
+});
+
+app.get('/api/dashboard/comprehensive', authMiddleware, async (c) => {
+  try {
+    const userId = c.get('userId');
+    const result = await dashboardSections.collect({ userId }, c.req.query('sections'));
+    const names = Object.keys(result.data);
+
+    if (names.length === 0) {
+      return c.json({
+        success: false,
+        error: `Unknown sections: ${result.unknown.join(', ')}`,
+        available: dashboardSections.sectionNames
+      }, 400);
+    }
+
+    const anyData = names.some(name => result.data[name] !== null);
+    return c.json({
+      success: anyData,
+      data: result.data,
+      meta: {
+        source: 'real',
+        ts: Date.now(),
+        partial: !result.complete,
+        sections: result.sections,
+        ...(result.unknown.length ? { unknown: result.unknown } : {})
+      }
+    }, anyData ? 200 : 503);
+  } catch (error) {
+    console.error('Comprehensive dashboard error:', error);
+    return c.json({ success: false, error: error.message }, 500);
+  }
+});
+'''
+
+# Widget method -> the section it reads (getPerformanceHistory's fallback
+# synthesises the chart from the portfolio totals)
+WIDGET_SECTIONS = {
+    'renderPortfolioSummaryWidget': 'portfolio',
+    'renderMarketOverviewWidget': 'market',
+    'getPerformanceHistory': 'portfolio',
+}
+
+# getPerformanceHistory's primary call: /api/portfolio/performance does not
+# exist (and its result was read from response.data, which is undefined)
+PERFORMANCE_PRIMARY_OLD = '''            const response = await this.authFetch('/api/portfolio/performance');
+            const data = response.ok ? await response.json() : {};
+            if (data.success && data.data?.history) {
+                return response.data.history;
+            }'''
+
+PERFORMANCE_PRIMARY_NEW = '''            const response = await this.authFetch('/api/dashboard/comprehensive?sections=performance');
+            const data = response.ok ? await response.json() : {};
+            const history = data.data?.performance?.history;
+            if (data.success && history?.length) {
+                return history;
+            }'''
+
+
+def patch_server():
+    with open(SERVER_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if "app.get('/api/dashboard/comprehensive'," in content:
+        print("⚠️ Aggregator route already present")
+        return None
+
+    # Insert after the comprehensive-real route
+    start = content.find("app.get('/api/dashboard/comprehensive-real'")
+    end = content.find('\n});\n', start) if start != -1 else -1
+    if end == -1:
+        print("❌ Could not find the comprehensive-real route")
+        return False
+    end += len('\n});\n')
+    content = content[:end] + AGGREGATOR_ROUTE + content[end:]
+
+    anchor = "const { logger } = require('./utils/logMasking');\n"
+    if AGGREGATOR_REQUIRE not in content:
+        if anchor not in content:
+            print("❌ Could not find the require block")
+            return False
+        content = content.replace(anchor, anchor + AGGREGATOR_REQUIRE, 1)
+
+    with open(SERVER_FILE, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print("✅ Added /api/dashboard/comprehensive aggregator")
+    return True
+
+
+def patch_frontend():
+    with open(APP_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    changed = 0
+    missing = []
+    for method, section in WIDGET_SECTIONS.items():
+        m = re.search(r'\n    async ' + method + r'\(', content)
+        if not m:
+            missing.append(method)
+            continue
+        # Only touch the call inside this method
+        end = content.find('\n    }\n', m.end())
+        body = content[m.end():end]
+        new_body = body.replace("this.authFetch('/api/dashboard/comprehensive')",
+                                f"this.authFetch('/api/dashboard/comprehensive?sections={section}')")
+        if method == 'getPerformanceHistory':
+            new_body = new_body.replace(PERFORMANCE_PRIMARY_OLD, PERFORMANCE_PRIMARY_NEW)
+        if new_body != body:
+            content = content[:m.end()] + new_body + content[end:]
+            changed += 1
+
+    if changed:
+        with open(APP_FILE, 'w', encoding='utf-8') as f:
+            f.write(content)
+    print(f"✅ {changed} widget(s) now request a single dashboard section")
+    if missing:
+        print(f"❌ Widget methods not found: {', '.join(missing)}")
+        return False
+    return True if changed else None
+
+
+if __name__ == '__main__':
+    # Both halves always run; exit non-zero if either is missing an anchor
+    # (None = already applied)
+    results = [patch_server(), patch_frontend()]
+    if False in results:
+        sys.exit(1)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Inject a concurrent dashboard scheduler into app.js
+#
+# loadAllWidgets() already fires every loadWidgetData() in parallel
+# (Promise.all), but with no visibility into which widget is slow. This
+# replaces it with a small scheduler: widget renders start immediately
+# through a pool sized to the browser's per-host connection limit
+# (this.widgetConcurrency, default 6; a lower cap would only slow the
+# baseline down), each widget is painted by
+# loadWidgetData() as soon as its own data arrives, and per-widget timings
+# are kept in this.widgetTimings and published with a
+# 'titan:dashboard-loaded' event.
+
+with open('public/static/app.js', 'r', encoding='utf-8') as f:
+    content = f.read()
+
+print("Original file size:", len(content), "bytes")
+
+old_loader = '''    async loadAllWidgets() {
+        if (!this.dashboardLayout) return;
+
+        const visibleWidgets = this.dashboardLayout.widgets.filter(w => w.isVisible);
+
+        // Load widget data in parallel
+        const widgetPromises = visibleWidgets.map(widget => this.loadWidgetData(widget));
+        await Promise.all(widgetPromises);
+    }'''
+
+new_loader = '''    async loadAllWidgets() {
+        if (!this.dashboardLayout) return;
+
+        const visibleWidgets = this.dashboardLayout.widgets.filter(w => w.isVisible);
+
+        // Load widget data in parallel, painting each widget as it arrives
+        await this.scheduleWidgetLoads(visibleWidgets);
+    }
+
+    async scheduleWidgetLoads(widgets, concurrency = this.widgetConcurrency || 6) {
+        const startedAt = performance.now();
+        const queue = [...widgets];
+        this.widgetTimings = {};
+
+        // Each runner pulls the next widget as soon as its previous one is painted
+        const runner = async () => {
+            while (queue.length) {
+                const widget = queue.shift();
+                const widgetStart = performance.now();
+                await this.loadWidgetData(widget);
+                this.widgetTimings[widget.id] = {
+                    type: widget.type,
+                    waitMs: Math.round(widgetStart - startedAt),
+                    durationMs: Math.round(performance.now() - widgetStart)
+                };
+            }
+        };
+
+        const runners = Array.from({ length: Math.min(concurrency, queue.length) }, runner);
+        await Promise.all(runners);
+
+        this.dashboardLoadMs = Math.round(performance.now() - startedAt);
+        document.dispatchEvent(new CustomEvent('titan:dashboard-loaded', {
+            detail: { totalMs: this.dashboardLoadMs, widgets: this.widgetTimings }
+        }));
+    }'''
+
+if 'scheduleWidgetLoads(' in content:
+    print("ℹ️ Dashboard scheduler already injected")
+elif old_loader in content:
+    content = content.replace(old_loader, new_loader)
+    print("✅ Injected dashboard scheduler into loadAllWidgets")
+else:
+    print("⚠️ loadAllWidgets pattern not found")
+
+with open('public/static/app.js', 'w', encoding='utf-8') as f:
+    f.write(content)
+
+print("Updated file size:", len(content), "bytes")
@@ -25,23 +25,13 @@ app.get('/api/market/prices', optionalAuthMiddleware, async (c) => {
   try {
     const symbols = c.req.query('symbols');
     const cryptoIds = symbols 
-      ? symbols.split(',').map(s => {
-          const map = {
-            'BTC': 'bitcoin', 'ETH': 'ethereum', 'ADA': 'cardano',
-            'DOT': 'polkadot', 'LINK': 'chainlink', 'XRP': 'ripple',
-            'SOL': 'solana', 'AVAX': 'avalanche-2'
-          };
-          return map[s.toUpperCase()] || s.toLowerCase();
-        })
+      ? symbols.split(',').map(symbolToCoinId)
       : ['bitcoin', 'ethereum', 'cardano', 'polkadot', 'chainlink'];
     
     const prices = await getCryptoPrices(cryptoIds);
     
-    return c.json({
-      success: true,
-      data: prices,
-      timestamp: new Date().toISOString()
-    });
+    // Strong ETag + 304 / precompressed body while the cached prices are unchanged
+    return sendConditionalJson(c, `market:prices:${cryptoIds.join(',')}`, prices);
   } catch (error) {
     console.error('Market prices error:', error);
     return c.json({ success: false, error: error.message }, 500);
@@ -53,11 +43,7 @@ app.get('/api/market/overview', optionalAuthMiddleware, async (c) => {
   try {
     const marketData = await getMarketOverview();
     
-    return c.json({
-      success: true,
-      data: marketData,
-      timestamp: new Date().toISOString()
-    });
+    return sendConditionalJson(c, 'market:overview', marketData);
   } catch (error) {
     console.error('Market overview error:', error);
     return c.json({ success: false, error: error.message }, 500);
@@ -67,6 +53,14 @@ app.get('/api/market/overview', optionalAuthMiddleware, async (c) => {
 '''
     
     lines.insert(insert_line, new_api)
+
+    # ETag / conditional GET helper used by the handlers above
+    etag_require = "const { sendConditionalJson } = require('./utils/conditionalJson');\n"
+    if etag_require not in lines:
+        for i, line in enumerate(lines):
+            if line.startswith("const { logger } = require('./utils/logMasking');"):
+                lines.insert(i + 1, etag_require)
+                break
     
     # Write back
     with open('server-real-v3.js', 'w', encoding='utf-8') as f:
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# Server-sent price stream for the watchlist widget
+#
+# The watchlist widget (fix_watchlist_widget.py / fix_watchlist_with_fetch.py)
+# polls /api/market/prices with a hardcoded symbol list, so every open
+# dashboard adds its own request stream and CoinGecko sees more calls as
+# cache entries expire. This injector adds:
+#
+#   server-real-v3.js  one shared PriceStream poller (utils/priceStream.js)
+#                      and GET /api/market/prices/stream, an SSE endpoint that
+#                      sends a snapshot on connect and then only the symbols
+#                      whose quotes changed (poll interval:
+#                      PRICE_STREAM_INTERVAL_MS, default 15000)
+#   app.js             subscribePriceStream() / applyPriceUpdates(); the
+#                      watchlist widget renders from the stream snapshot and
+#                      later updates are patched into its rows in place.
+#                      One /api/market/prices fetch remains as a fallback.
+#
+# Run after add_market_prices_api.py (the stream route goes after
+# /api/market/prices and reuses getCryptoPrices). Only symbols in the
+# registry (utils/symbolRegistry.js) are accepted by the stream.
+#
+# Usage:
+#   python3 add_price_stream.py   # exits 1 if an anchor is missing
+import sys
+
+from js_spans import class_members
+
+SERVER_FILE = 'server-real-v3.js'
+APP_FILE = 'public/static/app.js'
+
+STREAM_REQUIRES = [
+    ("const { cors } = require('hono/cors');\n",
+     "const { streamSSE } = require('hono/streaming');\n"),
+    ("const { logger } = require('./utils/logMasking');\n",
+     "const { PriceStream } = require('./utils/priceStream');\n"),
+    ("const { symbolToCoinId, coinIdToSymbol, coinName } = require('./utils/symbolRegistry');\n",
+     "const { isKnownSymbol } = require('./utils/symbolRegistry');\n"),
+]
+
+STREAM_ROUTE = '''
+// Live price stream - one shared poller, SSE fan-out of changed symbols only
+const priceStream = new PriceStream({
+  intervalMs: parseInt(process.env.PRICE_STREAM_INTERVAL_MS) || 15000,
+  fetchPrices: (symbols) => getCryptoPrices(symbols.map(symbolToCoinId))
+});
+
+app.get('/api/market/prices/stream', optionalAuthMiddleware, (c) => {
+  // Registry tickers only: every accepted string becomes a polled symbol
+  const symbols = (c.req.query('symbols') || 'BTC,ETH,ADA,DOT,LINK').split(',')
+    .filter(isKnownSymbol).slice(0, 50);
+  if (symbols.length === 0) {
+    return c.json({ success: false, error: 'No known symbols requested' }, 400);
+  }
+
+  return streamSSE(c, async (stream) => {
+    const unsubscribe = priceStream.subscribe(symbols, (event, data) =>
+      stream.writeSSE({ event, data: JSON.stringify(data) })
+    );
+    stream.onAbort(unsubscribe);
+
+    // Comment heartbeat keeps proxies from closing an idle stream
+    while (!stream.aborted) {
+      await stream.sleep(25000);
+      if (!stream.aborted) {
+        await stream.write(': ping\\n\\n');
+      }
+    }
+    unsubscribe();
+  });
+});
+'''
+
+HELPER_ANCHOR = '    async initializeModuleLoader() {'
+
+HELPER_CODE = '''    /**
+     * Subscribe to the shared server-side price stream (SSE). Resolves with
+     * the first snapshot; later 'prices' events carry only changed symbols
+     * and are patched into the rendered watchlist rows in place.
+     */
+    subscribePriceStream(symbols, timeoutMs = 5000) {
+        const key = symbols.map(s => s.toUpperCase()).sort().join(',');
+        if (this.priceStream && this.priceStreamKey === key) {
+            return this.priceStreamReady;
+        }
+        if (this.priceStream) {
+            this.priceStream.close();
+        }
+
+        this.livePrices = this.livePrices || {};
+        this.priceStreamKey = key;
+        const source = new EventSource(`/api/market/prices/stream?symbols=${encodeURIComponent(key)}`);
+        this.priceStream = source;
+
+        this.priceStreamReady = new Promise((resolve, reject) => {
+            const timer = setTimeout(() => {
+                // Let the next render retry instead of waiting on a dead stream
+                source.close();
+                if (this.priceStream === source) {
+                    this.priceStream = null;
+                }
+                reject(new Error('Price stream timeout'));
+            }, timeoutMs);
+
+            // Sent on connect and again after every automatic reconnect
+            source.addEventListener('snapshot', (event) => {
+                clearTimeout(timer);
+                const snapshot = JSON.parse(event.data);
+                Object.assign(this.livePrices, snapshot);
+                this.applyPriceUpdates(snapshot);
+                resolve(this.livePrices);
+            });
+        });
+
+        source.addEventListener('prices', (event) => {
+            const changed = JSON.parse(event.data);
+            Object.assign(this.livePrices, changed);
+            this.applyPriceUpdates(changed);
+        });
+
+        return this.priceStreamReady;
+    }
+
+    applyPriceUpdates(prices) {
+        for (const [symbol, coin] of Object.entries(prices)) {
+            document.querySelectorAll(`[data-price-symbol="${symbol}"]`).forEach(row => {
+                const price = row.querySelector('[data-field="price"]');
+                const change = row.querySelector('[data-field="change"]');
+                const up = coin.price_change_percentage_24h >= 0;
+                if (price) {
+                    price.textContent = `$${coin.current_price.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 6 })}`;
+                }
+                if (change) {
+                    change.className = `flex items-center ${up ? 'text-green-400' : 'text-red-400'} text-xs`;
+                    change.innerHTML = `<span class="mr-1">${up ? '▲' : '▼'}</span>
+                                        ${up ? '+' : ''}${coin.price_change_percentage_24h.toFixed(2)}%`;
+                }
+            });
+        }
+    }
+
+'''
+
+WIDGET_FETCH_START = '        // Fetch real-time cryptocurrency prices from API\n'
+WIDGET_FETCH_END = '        // Limit coins based on widget settings\n'
+
+WIDGET_SUBSCRIBE = '''        // Live prices from the shared server-side poller (SSE), one fetch as fallback
+        const symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK'];
+        let prices = {};
+        try {
+            prices = await this.subscribePriceStream(symbols);
+        } catch (error) {
+            console.warn('Price stream unavailable, fetching watchlist prices once:', error);
+            try {
+                const response = await fetch(`/api/market/prices?symbols=${symbols.join(',')}`);
+                const data = response.ok ? await response.json() : {};
+                prices = data.success && data.data ? data.data : {};
+            } catch (fetchError) {
+                console.warn('Failed to fetch watchlist prices:', fetchError);
+            }
+        }
+        let coins = symbols.filter(symbol => prices[symbol]).map((symbol, idx) => ({
+            ...prices[symbol],
+            market_cap_rank: idx + 1,
+            favorite: true
+        }));
+
+'''
+
+# Hooks for applyPriceUpdates() in the row template
+ROW_MARKUP = [
+    ('<div class="flex items-center justify-between p-3 bg-gray-700 rounded-lg',
+     '<div data-price-symbol="${coin.symbol}" class="flex items-center justify-between p-3 bg-gray-700 rounded-lg'),
+    ('<div class="font-medium text-white">$${coin.current_price',
+     '<div data-field="price" class="font-medium text-white">$${coin.current_price'),
+    ('<div class="flex items-center ${changeClass} text-xs">',
+     '<div data-field="change" class="flex items-center ${changeClass} text-xs">'),
+]
+
+
+def patch_server():
+    with open(SERVER_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if "'/api/market/prices/stream'" in content:
+        print("⚠️ Price stream route already present")
+        return None
+
+    start = content.find("app.get('/api/market/prices',")
+    end = content.find('\n});\n', start) if start != -1 else -1
+    if end == -1:
+        print("❌ /api/market/prices not found (run add_market_prices_api.py first)")
+        return False
+    end += len('\n});\n')
+    content = content[:end] + STREAM_ROUTE + content[end:]
+
+    for anchor, require in STREAM_REQUIRES:
+        if require not in content:
+            if anchor not in content:
+                print(f"❌ Could not find require anchor: {anchor.strip()}")
+                return False
+            content = content.replace(anchor, anchor + require, 1)
+
+    with open(SERVER_FILE, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print("✅ Added /api/market/prices/stream (shared poller + SSE)")
+    return True
+
+
+def patch_frontend():
+    with open(APP_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if 'subscribePriceStream(symbols' in content:
+        print("⚠️ Watchlist already subscribes to the price stream")
+        return None
+
+    widget = next((m for m in class_members(content) if m.name == 'renderWatchlistWidget'), None)
+    if not widget:
+        print("❌ renderWatchlistWidget not found")
+        return False
+
+    body = content[widget.body_start:widget.end]
+    start = body.find(WIDGET_FETCH_START)
+    end = body.find(WIDGET_FETCH_END)
+    if start == -1 or end == -1:
+        print("❌ Watchlist fetch block not found (run fix_watchlist_with_fetch.py first)")
+        return False
+    body = body[:start] + WIDGET_SUBSCRIBE + body[end:]
+    for old, new in ROW_MARKUP:
+        if old not in body:
+            print(f"⚠️ Row markup not found: {old[:40]}...")
+        body = body.replace(old, new, 1)
+    content = content[:widget.body_start] + body + content[widget.end:]
+
+    if HELPER_ANCHOR not in content:
+        print(f"❌ Could not find helper insertion point: {HELPER_ANCHOR.strip()}")
+        return False
+    content = content.replace(HELPER_ANCHOR, HELPER_CODE + HELPER_ANCHOR, 1)
+
+    with open(APP_FILE, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print("✅ Watchlist widget now subscribes to the price stream")
+    return True
+
+
+if __name__ == '__main__':
+    # Both halves always run; exit non-zero if either is missing an anchor
+    # (None = already applied)
+    results = [patch_server(), patch_frontend()]
+    if False in results:
+        sys.exit(1)
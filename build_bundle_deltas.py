@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# Delta updates between successive hashed app bundles
+#
+# Every patch run publishes a new app.<md5>.js (~450 KB) that usually
+# differs from the previous one by a few kilobytes. This builds a compact
+# line-level delta from each of the last N published bundles to the current
+# one, plus public/static/deltas/index.json. service-worker.js uses the index
+# to rebuild the new bundle from a cached old one (verified by SHA-256)
+# instead of downloading it in full.
+#
+# Delta format (JSON): {"from", "to", "ops"} where each op is either
+# [start, count] - copy lines from the old bundle - or a string of new lines
+# joined with "\n". Lines are split on "\n" only, matching String.split().
+#
+# Usage:
+#   python3 build_bundle_deltas.py                       # bundle loaded by index.html
+#   python3 build_bundle_deltas.py --current public/static/app.3c96e59c.js --keep 5
+import difflib
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'public', 'static')
+ENTRY_HTML = os.path.join(ROOT, 'public', 'index.html')
+DELTA_DIR = os.path.join(STATIC_DIR, 'deltas')
+INDEX_FILE = os.path.join(DELTA_DIR, 'index.json')
+BUNDLE_NAME = 'app'
+KEEP = 3
+
+HASHED_RE = re.compile(r'^([\w-]+)\.([0-9a-f]{8})\.js$')
+
+
+def static_url(path):
+    return '/static/' + os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+
+
+def read_text(path):
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def hashed_bundles(name):
+    """Return {hash: path} for every published <name>.<hash>.js."""
+    bundles = {}
+    for dirpath, _, filenames in os.walk(STATIC_DIR):
+        if os.path.abspath(dirpath).startswith(DELTA_DIR):
+            continue
+        for filename in filenames:
+            m = HASHED_RE.match(filename)
+            if m and m.group(1) == name:
+                bundles.setdefault(m.group(2), os.path.join(dirpath, filename))
+    return bundles
+
+
+def current_bundle(name):
+    # The hashed bundle the real entry page loads
+    with open(ENTRY_HTML, 'r', encoding='utf-8') as f:
+        html = f.read()
+    m = re.search(r'src="/static/((?:[\w-]+/)*' + re.escape(name) + r'\.[0-9a-f]{8}\.js)', html)
+    return os.path.join(STATIC_DIR, m.group(1)) if m else None
+
+
+def publish_times(paths):
+    """{path: unix time the bundle was first committed}. Checkouts give every
+    file the same mtime, so git is the only stable publish order; bundles not
+    committed yet (fresh builds) use their mtime."""
+    times = {path: os.path.getmtime(path) for path in paths}
+    rel = {os.path.relpath(path, ROOT): path for path in paths}
+    try:
+        log = subprocess.run(['git', 'log', '--no-renames', '--diff-filter=A', '--format=@%ct',
+                              '--name-only', '--', *rel],
+                             cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return times
+    committed = None
+    for line in log.splitlines():
+        if line.startswith('@'):
+            committed = int(line[1:])
+        elif line in rel:
+            # Newest commit first, so the last match is the first add
+            times[rel[line]] = committed
+    return times
+
+
+def compute_ops(old_lines, new_lines):
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    ops = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2 - i1])
+        elif j2 > j1:
+            ops.append('\n'.join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_ops(old_lines, ops):
+    # Same algorithm as applyDelta() in service-worker.js
+    out = []
+    for op in ops:
+        if isinstance(op, list):
+            out.extend(old_lines[op[0]:op[0] + op[1]])
+        else:
+            out.extend(op.split('\n'))
+    return '\n'.join(out)
+
+
+def load_index():
+    try:
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'bundles': {}}
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    current_path = current_bundle(BUNDLE_NAME)
+    keep = KEEP
+    for i, arg in enumerate(args[:-1]):
+        if arg == '--current':
+            current_path = os.path.abspath(args[i + 1])
+        elif arg == '--keep':
+            keep = int(args[i + 1])
+
+    if not current_path or not os.path.exists(current_path):
+        sys.exit("❌ Could not find the current hashed bundle (use --current)")
+
+    new_text = read_text(current_path)
+    new_hash = hashlib.md5(new_text.encode('utf-8')).hexdigest()[:8]
+    new_lines = new_text.split('\n')
+    new_size = len(new_text.encode('utf-8'))
+
+    index = load_index()
+    previous = index['bundles'].get(BUNDLE_NAME, {})
+    history = [h for h in previous.get('history', []) if h != new_hash]
+
+    # Older builds: recorded publish history first, then other bundles on disk,
+    # newest commit first. Bundles published together cannot be ordered, so a
+    # tie at the cut-off keeps the whole group rather than an arbitrary part.
+    bundles = hashed_bundles(BUNDLE_NAME)
+    times = publish_times(list(bundles.values()))
+    on_disk = sorted((h for h in bundles if h != new_hash and h not in history),
+                     key=lambda h: (-times[bundles[h]], h))
+    candidates = [h for h in history if h in bundles][:keep]
+    cutoff = None
+    for old_hash in on_disk:
+        if len(candidates) >= keep and times[bundles[old_hash]] != cutoff:
+            break
+        candidates.append(old_hash)
+        cutoff = times[bundles[old_hash]]
+
+    os.makedirs(DELTA_DIR, exist_ok=True)
+    deltas = {}
+    print(f"📦 Current bundle {static_url(current_path)} ({new_size:,} bytes)")
+    for old_hash in candidates:
+        old_lines = read_text(bundles[old_hash]).split('\n')
+        ops = compute_ops(old_lines, new_lines)
+        assert apply_ops(old_lines, ops) == new_text, f"delta {old_hash} does not round-trip"
+
+        delta_path = os.path.join(DELTA_DIR, f'{BUNDLE_NAME}.{old_hash}-{new_hash}.json')
+        payload = json.dumps({'from': old_hash, 'to': new_hash, 'ops': ops},
+                             ensure_ascii=False, separators=(',', ':'))
+        with open(delta_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        size = len(payload.encode('utf-8'))
+        deltas[old_hash] = {'url': static_url(delta_path), 'size': size}
+        print(f"   ✅ {old_hash} → {new_hash}: {size:,} bytes ({size / new_size:.1%} of full bundle)")
+
+    index['bundles'][BUNDLE_NAME] = {
+        'hash': new_hash,
+        'url': static_url(current_path),
+        'size': new_size,
+        'sha256': hashlib.sha256(new_text.encode('utf-8')).hexdigest(),
+        'deltas': deltas,
+        'history': [new_hash] + history[:keep * 2],
+    }
+    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+        f.write('\n')
+
+    # Drop deltas that are no longer listed in the index
+    listed = {os.path.basename(d['url']) for b in index['bundles'].values() for d in b['deltas'].values()}
+    for filename in os.listdir(DELTA_DIR):
+        if filename.endswith('.json') and filename != 'index.json' and filename not in listed:
+            os.remove(os.path.join(DELTA_DIR, filename))
+            print(f"   🗑️ Removed stale delta {filename}")
+
+    print(f"✅ Wrote {os.path.relpath(INDEX_FILE, ROOT)} ({len(deltas)} deltas)")
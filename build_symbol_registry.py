@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# Build the shared symbol <-> CoinGecko id registry
+#
+# add_crypto_prices_endpoint.py and add_market_prices_api.py used to embed
+# their own eight-entry symbolMap, rebuilt on every request, and fell back
+# to id.toUpperCase().substring(0, 3) for unknown coins (so 'bitcoin-cash'
+# became 'BIT', colliding with others). This generator precomputes both
+# directions from a local coin-list snapshot (CoinGecko /coins/list format)
+# into data/symbol-registry.json, which utils/symbolRegistry.js loads once
+# at startup into two Maps for O(1) lookups.
+#
+# Several tokens share a ticker (bridged/wrapped copies), so each symbol is
+# resolved to one canonical id: PREFERRED_IDS first, then market_cap_rank,
+# then the shortest id. /coins/list has no ranks, so --refresh also reads
+# the top RANKED_PAGES pages of /coins/markets and stores market_cap_rank
+# in the snapshot. A shared ticker that is neither pinned nor ranked falls
+# back to the shortest id, which is effectively arbitrary (it can pick a
+# bridged or scam token); those are counted in the output - pin them.
+#
+# Usage:
+#   python3 build_symbol_registry.py                 # from the local snapshot
+#   python3 build_symbol_registry.py --refresh       # re-download the snapshot first
+#   python3 build_symbol_registry.py --pin LINK=chainlink
+import json
+import os
+import sys
+import urllib.request
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_FILE = os.path.join(ROOT, 'data', 'coingecko-coins-list.json')
+REGISTRY_FILE = os.path.join(ROOT, 'data', 'symbol-registry.json')
+COINS_LIST_URL = 'https://api.coingecko.com/api/v3/coins/list'
+COINS_MARKETS_URL = ('https://api.coingecko.com/api/v3/coins/markets'
+                     '?vs_currency=usd&order=market_cap_desc&per_page=250&page={page}')
+RANKED_PAGES = 4  # top 1,000 coins by market cap
+
+# Canonical ids for tickers shared by several listed tokens
+PREFERRED_IDS = {
+    'BTC': 'bitcoin', 'ETH': 'ethereum', 'ADA': 'cardano', 'DOT': 'polkadot',
+    'LINK': 'chainlink', 'XRP': 'ripple', 'SOL': 'solana', 'AVAX': 'avalanche-2',
+    'USDT': 'tether', 'USDC': 'usd-coin', 'BNB': 'binancecoin', 'DOGE': 'dogecoin',
+    'MATIC': 'matic-network', 'LTC': 'litecoin', 'TRX': 'tron', 'UNI': 'uniswap',
+}
+
+
+def load_snapshot(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        coins = json.load(f)
+    return [c for c in coins if c.get('id') and c.get('symbol')]
+
+
+def fetch_market_ranks(pages=RANKED_PAGES):
+    """{id: market_cap_rank} for the largest coins (/coins/markets)."""
+    ranks = {}
+    for page in range(1, pages + 1):
+        with urllib.request.urlopen(COINS_MARKETS_URL.format(page=page), timeout=30) as response:
+            rows = json.load(response)
+        for row in rows:
+            if row.get('market_cap_rank'):
+                ranks[row['id']] = row['market_cap_rank']
+        if len(rows) < 250:
+            break
+    return ranks
+
+
+def snapshot_entry(coin, ranks):
+    entry = {'id': coin['id'], 'symbol': coin['symbol'], 'name': coin['name']}
+    if coin['id'] in ranks:
+        entry['market_cap_rank'] = ranks[coin['id']]
+    return entry
+
+
+def refresh_snapshot(path):
+    with urllib.request.urlopen(COINS_LIST_URL, timeout=30) as response:
+        coins = json.load(response)
+    ranks = fetch_market_ranks()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n' + ',\n'.join(
+            '  ' + json.dumps(snapshot_entry(c, ranks), ensure_ascii=False)
+            for c in sorted(coins, key=lambda c: c['id'])
+        ) + '\n]\n')
+    return len(coins), len(ranks)
+
+
+def build_registry(coins, preferred):
+    """Return (symbols: SYMBOL -> canonical id, ids: id -> [SYMBOL, name],
+    collisions, unresolved: shared tickers decided by id length alone)."""
+    candidates = {}
+    ids = {}
+    for coin in coins:
+        symbol = coin['symbol'].strip().upper()
+        ids[coin['id']] = [symbol, coin.get('name') or coin['id']]
+        candidates.setdefault(symbol, []).append(coin)
+
+    def rank(coin):
+        market_rank = coin.get('market_cap_rank') or float('inf')
+        return (market_rank, len(coin['id']), coin['id'])
+
+    symbols = {}
+    collisions = 0
+    unresolved = []
+    for symbol, group in candidates.items():
+        if len(group) > 1:
+            collisions += 1
+        pinned = preferred.get(symbol)
+        if pinned and pinned in ids:
+            symbols[symbol] = pinned
+        else:
+            symbols[symbol] = min(group, key=rank)['id']
+            if len(group) > 1 and not any(c.get('market_cap_rank') for c in group):
+                unresolved.append(symbol)
+
+    return dict(sorted(symbols.items())), dict(sorted(ids.items())), collisions, sorted(unresolved)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    preferred = dict(PREFERRED_IDS)
+    for i, arg in enumerate(args[:-1]):
+        if arg == '--pin':
+            symbol, _, coin_id = args[i + 1].partition('=')
+            preferred[symbol.upper()] = coin_id
+
+    if '--refresh' in args:
+        count, ranked = refresh_snapshot(SNAPSHOT_FILE)
+        print(f"⬇️ Downloaded {count} coins ({ranked} with a market cap rank) "
+              f"into {os.path.relpath(SNAPSHOT_FILE, ROOT)}")
+
+    coins = load_snapshot(SNAPSHOT_FILE)
+    symbols, ids, collisions, unresolved = build_registry(coins, preferred)
+
+    registry = {
+        'source': os.path.relpath(SNAPSHOT_FILE, ROOT),
+        'count': len(ids),
+        'symbols': symbols,
+        'ids': ids,
+    }
+    with open(REGISTRY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(registry, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+
+    print(f"✅ Wrote {os.path.relpath(REGISTRY_FILE, ROOT)}: {len(symbols)} symbols, {len(ids)} ids")
+    print(f"   {collisions} tickers shared by several ids resolved to one canonical id")
+    if unresolved:
+        shown = ', '.join(unresolved[:10]) + (', ...' if len(unresolved) > 10 else '')
+        print(f"⚠️ {len(unresolved)} shared tickers have no pin or rank, picked by shortest id: {shown}")
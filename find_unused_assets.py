@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Unreferenced static asset analyzer
+#
+# Builds the reference graph of public/static starting from the real entry
+# HTML (public/index.html) and service-worker.js. It follows <script src>,
+# <link href>, CSS url()/@import, ES import/import() specifiers and string
+# URLs inside scripts, then lists every file under public/static that is
+# never reached (backups, stale hashed bundles, test-*.html, ...) with its
+# size, plus referenced /static URLs that do not exist. Template URLs such
+# as `/static/modules/${name}.js` are treated as globs, so files a loader
+# can reach dynamically are kept.
+#
+# Usage:
+#   python3 find_unused_assets.py                      # report unreachable files
+#   python3 find_unused_assets.py --entry public/x.html  # extra entry point
+#   python3 find_unused_assets.py --prune-to dist-static # write pruned deploy tree (replaces it)
+import fnmatch
+import os
+import posixpath
+import re
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = 'public'
+STATIC_DIR = 'public/static'
+DEFAULT_ENTRIES = ['public/index.html', 'public/static/service-worker.js']
+
+# Files we can parse for further references
+PARSED_EXTENSIONS = ('.html', '.js', '.mjs', '.css', '.json')
+
+HTML_ATTR_RE = re.compile(r"""\b(?:src|href|data-src)\s*=\s*(['"])([^'"]+)\1""", re.IGNORECASE)
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)|@import\s+(['"])([^'"]+)\3""")
+STRING_RE = re.compile(r"""(['"`])((?:\.{1,2}/|/)[^'"`\s<>]*)\1""")
+TEMPLATE_EXPR_RE = re.compile(r"\$\{[^}]*\}")
+
+
+def url_of(rel_path):
+    # public/static/app.js -> /static/app.js
+    return '/' + posixpath.relpath(rel_path.replace(os.sep, '/'), PUBLIC_DIR)
+
+
+def static_files():
+    files = {}
+    base = os.path.join(ROOT, STATIC_DIR)
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames.sort()
+        for name in sorted(filenames):
+            rel = os.path.relpath(os.path.join(dirpath, name), ROOT).replace(os.sep, '/')
+            files[url_of(rel)] = rel
+    return files
+
+
+def extract_refs(rel_path, content):
+    if rel_path.endswith('.html'):
+        refs = [m.group(2) for m in HTML_ATTR_RE.finditer(content)]
+        # Inline <script> and <style> blocks can reference assets too
+        refs += [m.group(2) for m in STRING_RE.finditer(content)]
+        refs += [m.group(2) or m.group(4) for m in CSS_URL_RE.finditer(content)]
+        return refs
+    if rel_path.endswith('.css'):
+        return [m.group(2) or m.group(4) for m in CSS_URL_RE.finditer(content)]
+    return [m.group(2) for m in STRING_RE.finditer(content)]
+
+
+def resolve(ref, from_url):
+    # Returns an absolute URL path (possibly a glob), or None for external refs
+    ref = ref.strip()
+    if ref.startswith(('http:', 'https:', '//', 'data:', 'mailto:', 'javascript:', '#')):
+        return None
+    ref = re.split(r'[?#]', ref, 1)[0]
+    if not ref:
+        return None
+    ref = TEMPLATE_EXPR_RE.sub('*', ref)
+    if not ref.startswith('/'):
+        ref = posixpath.join(posixpath.dirname(from_url), ref)
+    return posixpath.normpath(ref)
+
+
+def build_graph(entries):
+    """Walk references from the entry files.
+
+    Returns (reachable urls, edges, url -> file map, missing url -> referrer).
+    """
+    files = static_files()
+    reachable = set()
+    edges = {}
+    missing = {}
+    queue = []
+
+    for entry in entries:
+        rel = entry.replace(os.sep, '/')
+        if os.path.isfile(os.path.join(ROOT, rel)):
+            queue.append(url_of(rel))
+
+    while queue:
+        url = queue.pop()
+        if url in reachable:
+            continue
+        reachable.add(url)
+        rel = files.get(url) or (PUBLIC_DIR + url)
+        if not rel.endswith(PARSED_EXTENSIONS):
+            continue
+        try:
+            with open(os.path.join(ROOT, rel), 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except OSError:
+            continue
+
+        targets = set()
+        for ref in extract_refs(rel, content):
+            target = resolve(ref, url)
+            if not target:
+                continue
+            if '*' in target:
+                targets.update(u for u in files if fnmatch.fnmatchcase(u, target))
+            elif target in files:
+                targets.add(target)
+            elif target + '.js' in files:
+                # Extensionless ES module specifiers
+                targets.add(target + '.js')
+            elif target.startswith('/static/') and posixpath.splitext(target)[1]:
+                missing.setdefault(target, url)
+        edges[url] = targets
+        queue.extend(targets - reachable)
+
+    return reachable, edges, files, missing
+
+
+def human(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def write_pruned_tree(out_dir, unreachable_rels):
+    # Mirror public/ without the unreachable files under public/static. The
+    # target is emptied first, so files pruned since the last run do not
+    # linger in the deploy tree; that is only safe outside the source tree.
+    public_root = os.path.realpath(os.path.join(ROOT, PUBLIC_DIR))
+    target = os.path.realpath(out_dir)
+    if os.path.commonpath([public_root, target]) == public_root:
+        raise SystemExit(f"❌ Refusing to prune into the source tree ({PUBLIC_DIR}/ or a directory under it)")
+    if os.path.commonpath([os.path.realpath(ROOT), target]) == target:
+        raise SystemExit(f"❌ Refusing to replace {out_dir}: it contains the repository")
+    if os.path.isdir(target):
+        shutil.rmtree(target)
+
+    src_root = os.path.join(ROOT, PUBLIC_DIR)
+    skip = {os.path.join(ROOT, rel) for rel in unreachable_rels}
+    copied = 0
+    for dirpath, dirnames, filenames in os.walk(src_root):
+        for name in filenames:
+            src = os.path.join(dirpath, name)
+            if src in skip:
+                continue
+            dst = os.path.join(out_dir, os.path.relpath(src, src_root))
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copy2(src, dst)
+            copied += 1
+    return copied
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    entries = list(DEFAULT_ENTRIES)
+    prune_to = None
+    while args:
+        arg = args.pop(0)
+        if arg == '--entry' and args:
+            entries.append(args.pop(0))
+        elif arg == '--prune-to' and args:
+            prune_to = args.pop(0)
+
+    reachable, edges, files, missing = build_graph(entries)
+    unreachable = sorted(
+        (files[u] for u in files if u not in reachable),
+        key=lambda rel: -os.path.getsize(os.path.join(ROOT, rel))
+    )
+
+    total = sum(os.path.getsize(os.path.join(ROOT, rel)) for rel in files.values())
+    wasted = sum(os.path.getsize(os.path.join(ROOT, rel)) for rel in unreachable)
+
+    print(f"🔎 Entries: {', '.join(entries)}")
+    print(f"   {len(files) - len(unreachable)} of {len(files)} files in {STATIC_DIR} are reachable")
+
+    if not unreachable:
+        print("✅ No unreferenced static assets")
+    else:
+        print(f"\n🗑️ {len(unreachable)} unreachable files ({human(wasted)} of {human(total)}):")
+        for rel in unreachable:
+            print(f"   {human(os.path.getsize(os.path.join(ROOT, rel))):>9}  {rel}")
+
+    if missing:
+        print(f"\n⚠️ {len(missing)} referenced static URLs do not exist:")
+        for url in sorted(missing):
+            print(f"   {url}  (from {missing[url]})")
+
+    if prune_to:
+        copied = write_pruned_tree(prune_to, unreachable)
+        print(f"\n✅ Wrote pruned deploy tree to {prune_to} ({copied} files, {human(total - wasted)} static)")
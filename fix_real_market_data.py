@@ -28,7 +28,8 @@ new_market_function = '''async function getMarketOverview() {
   return await withCache(cacheKey, CONFIG.cache.marketData, async () => {
     try {
       // Fetch real market data from CoinGecko API (Free, no API key required)
-      const response = await axios.get('https://api.coingecko.com/api/v3/global', {
+      const baseUrl = process.env.COINGECKO_API_URL || 'https://api.coingecko.com/api/v3';
+      const response = await axios.get(`${baseUrl}/global`, {
         timeout: 5000
       });
       
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# Reverse of fix_all_api_calls.py
+#
+# fix_all_api_calls.py expanded every this.apiCall('...') into an inline
+# fetch() carrying its own Authorization/Content-Type headers and its own
+# localStorage read. This codemod finds those blocks by structure (any
+# whitespace, quote style or header order) and folds them back into one
+# shared TitanApp.authFetch() helper, then reports the bytes removed from
+# the bundle (parse size) and the gzip transfer size change.
+#
+# Usage:
+#   python3 fold_api_calls.py [path/to/app.js] [--dry-run]
+import gzip
+import re
+import sys
+
+TARGET = 'public/static/app.js'
+HELPER_NAME = 'authFetch'  # index_api_routes.py indexes calls to it by this name
+HELPER_ANCHOR = '    async initializeModuleLoader() {'
+
+HELPER_CODE = '''    /**
+     * Shared authenticated fetch - adds the bearer token and JSON content type.
+     * Returns the raw Response so call sites keep their .ok / .json() handling.
+     */
+    authFetch(url, options = {}) {
+        return fetch(url, {
+            ...options,
+            headers: {
+                'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
+                'Content-Type': 'application/json',
+                ...(options.headers || {})
+            }
+        });
+    }
+
+'''
+
+STRING = r"""(?:'[^'\n]*'|"[^"\n]*"|`[^`\n]*`)"""
+HEADER_KEY = r"""(?:'[^'\n]+'|"[^"\n]+"|[\w-]+)"""
+
+# fetch(URL, { [method: 'X',] headers: { K: V, ... } [,] })
+INLINE_FETCH_RE = re.compile(
+    r"(?<![\w.])fetch\(\s*(?P<url>" + STRING + r")\s*,\s*\{\s*"
+    r"(?:method\s*:\s*(?P<method>'[A-Z]+'|\"[A-Z]+\")\s*,\s*)?"
+    r"headers\s*:\s*\{(?P<headers>(?:\s*" + HEADER_KEY + r"\s*:\s*" + STRING + r"\s*,?)+)\s*\}\s*,?\s*"
+    r"\}\s*\)"
+)
+HEADER_RE = re.compile(r"(" + HEADER_KEY + r")\s*:\s*(" + STRING + r")")
+
+AUTH_VALUE_RE = re.compile(
+    r"^`Bearer \$\{localStorage\.getItem\(\s*(['\"])titan_auth_token\1\s*\)\}`$"
+)
+JSON_VALUE_RE = re.compile(r"""^(['"])application/json\1$""")
+
+
+def header_name(key):
+    return key.strip('\'"').lower()
+
+
+def is_auth_boilerplate(headers):
+    # Only fold blocks whose headers are exactly the helper's headers
+    pairs = HEADER_RE.findall(headers)
+    names = {header_name(k): v for k, v in pairs}
+    if len(names) != len(pairs) or 'authorization' not in names:
+        return False
+    if not AUTH_VALUE_RE.match(names.pop('authorization')):
+        return False
+    content_type = names.pop('content-type', None)
+    if content_type is not None and not JSON_VALUE_RE.match(content_type):
+        return False
+    return not names
+
+
+def class_span(content, class_name='TitanApp'):
+    # Offsets of the top-level class body; blocks outside it have no `this`
+    start = re.search(r'^class ' + class_name + r'\b[^\n]*\{\s*$', content, re.MULTILINE)
+    if not start:
+        return None
+    end = re.compile(r'^\}\s*$', re.MULTILINE).search(content, start.end())
+    return (start.end(), end.start() if end else len(content))
+
+
+def fold(content):
+    span = class_span(content)
+    if not span:
+        return content, 0, 0
+
+    folded = skipped = 0
+
+    def replace(match):
+        nonlocal folded, skipped
+        if not (span[0] <= match.start() < span[1]) or not is_auth_boilerplate(match.group('headers')):
+            skipped += 1
+            return match.group(0)
+        folded += 1
+        method = match.group('method')
+        if method:
+            return f"this.{HELPER_NAME}({match.group('url')}, {{ method: {method} }})"
+        return f"this.{HELPER_NAME}({match.group('url')})"
+
+    new_content = INLINE_FETCH_RE.sub(replace, content)
+
+    # Add the helper once, inside TitanApp
+    if folded and not re.search(r'^\s+' + HELPER_NAME + r'\(url', new_content, re.MULTILINE):
+        if HELPER_ANCHOR not in new_content:
+            raise SystemExit(f"❌ Could not find helper insertion point: {HELPER_ANCHOR.strip()}")
+        new_content = new_content.replace(HELPER_ANCHOR, HELPER_CODE + HELPER_ANCHOR, 1)
+
+    return new_content, folded, skipped
+
+
+def gzip_size(text):
+    return len(gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0))
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    dry_run = '--dry-run' in sys.argv
+    path = args[0] if args else TARGET
+
+    # Read the file
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content, folded, skipped = fold(content)
+
+    if not folded:
+        print("ℹ️ No inlined fetch/Authorization blocks found")
+        sys.exit(0)
+
+    before = len(content.encode('utf-8'))
+    after = len(new_content.encode('utf-8'))
+    gz_before = gzip_size(content)
+    gz_after = gzip_size(new_content)
+
+    print(f"✅ Folded {folded} inlined fetch blocks into this.{HELPER_NAME}()")
+    if skipped:
+        print(f"   Left {skipped} fetch blocks with custom headers or outside TitanApp untouched")
+    print(f"   Bytes removed: {before - after:,}")
+    print(f"   Parse size: {before:,} → {after:,} bytes ({after - before:+,})")
+    print(f"   Gzip size:  {gz_before:,} → {gz_after:,} bytes ({gz_after - gz_before:+,})")
+
+    if dry_run:
+        print("   (dry run - file not written)")
+    else:
+        # Write back
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Service-worker precache manifest generator
+#
+# Walks the deployable asset set (everything public/index.html loads
+# directly, found with find_unused_assets.build_graph) and writes
+# public/static/precache-manifest.js with a content revision per URL.
+# service-worker.js importScripts() the manifest and only re-fetches the
+# URLs whose revision changed, so a patch to one bundle no longer makes
+# clients re-download everything (or keep a stale copy).
+#
+# Digests are cached in .precache-digests.json keyed by mtime/size, so
+# re-runs only hash files that actually changed.
+#
+# Usage:
+#   python3 generate_precache_manifest.py                 # direct deps of index.html
+#   python3 generate_precache_manifest.py --all           # every reachable asset
+#   python3 generate_precache_manifest.py --include '/static/modules/*.js'
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+
+from find_unused_assets import ROOT, build_graph, url_of
+
+ENTRY_HTML = 'public/index.html'
+SERVICE_WORKER = 'public/static/service-worker.js'
+MANIFEST_FILE = 'public/static/precache-manifest.js'
+DIGEST_CACHE = os.path.join(ROOT, '.precache-digests.json')
+
+# Never precache the worker itself or the manifest it imports
+EXCLUDE = {url_of(SERVICE_WORKER), url_of(MANIFEST_FILE)}
+
+
+def load_digest_cache():
+    try:
+        with open(DIGEST_CACHE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def file_revision(rel_path, cache, stats):
+    # Re-use the previous digest when mtime and size are unchanged
+    st = os.stat(os.path.join(ROOT, rel_path))
+    key = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(rel_path)
+    if entry and entry[:2] == key:
+        stats['reused'] += 1
+        return entry[2]
+    h = hashlib.md5()
+    with open(os.path.join(ROOT, rel_path), 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    revision = h.hexdigest()[:8]
+    cache[rel_path] = key + [revision]
+    stats['hashed'] += 1
+    return revision
+
+
+def deployable_assets(include_all=False, include_globs=()):
+    """Return {url: rel_path} for the assets that should be precached."""
+    reachable, edges, files, _ = build_graph([ENTRY_HTML])
+    entry_url = url_of(ENTRY_HTML)
+    if include_all:
+        urls = set(u for u in reachable if u in files)
+    else:
+        urls = set(edges.get(entry_url, ()))
+    urls.update(u for u in files if any(fnmatch.fnmatchcase(u, g) for g in include_globs))
+    assets = {u: files[u] for u in sorted(urls - EXCLUDE)}
+    # The entry page itself is served at '/'
+    assets = {'/': ENTRY_HTML, **assets}
+    return assets
+
+
+def parse_manifest(content):
+    entries = {}
+    for line in content.splitlines():
+        line = line.strip().rstrip(',')
+        if line.startswith('{'):
+            entry = json.loads(line)
+            entries[entry['url']] = entry['revision']
+    return entries
+
+
+def render_manifest(entries):
+    lines = ',\n'.join(f"  {json.dumps(e, ensure_ascii=False)}" for e in entries)
+    return (
+        "// Generated by generate_precache_manifest.py - do not edit by hand.\n"
+        "// Consumed by service-worker.js via importScripts().\n"
+        f"self.__PRECACHE_MANIFEST = [\n{lines}\n];\n"
+    )
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    include_all = '--all' in args
+    include_globs = [args[i + 1] for i, a in enumerate(args[:-1]) if a == '--include']
+
+    cache = load_digest_cache()
+    stats = {'hashed': 0, 'reused': 0}
+    assets = deployable_assets(include_all, include_globs)
+    entries = [{'url': url, 'revision': file_revision(rel, cache, stats)} for url, rel in assets.items()]
+
+    # Keep only digests for files that still exist
+    cache = {rel: v for rel, v in cache.items() if os.path.exists(os.path.join(ROOT, rel))}
+    with open(DIGEST_CACHE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+    manifest_path = os.path.join(ROOT, MANIFEST_FILE)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = f.read()
+    except OSError:
+        previous = ''
+
+    content = render_manifest(entries)
+    if content == previous:
+        print(f"✅ {MANIFEST_FILE} is up to date ({len(entries)} assets)")
+        sys.exit(0)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    old = parse_manifest(previous)
+    changed = [e['url'] for e in entries if old.get(e['url']) != e['revision']]
+    removed = [url for url in old if url not in {e['url'] for e in entries}]
+
+    print(f"✅ Wrote {MANIFEST_FILE} ({len(entries)} assets)")
+    print(f"   {stats['hashed']} files hashed, {stats['reused']} digests reused")
+    print(f"   {len(changed)} revisions changed, {len(removed)} assets dropped")
+    for url in changed[:20]:
+        print(f"   ↻ {url}")
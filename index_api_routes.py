@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# Route inventory + client/server endpoint cross-reference
+#
+# Extracts every app.get/post/... route from server-real-v3.js and the
+# express routers in server/routes (mounted via server/index.js), and every
+# fetch()/apiCall()/authFetch() URL from public/static/**/*.js. Both sets are
+# kept in a cached index (.route-index.json, keyed by file mtime/size) so
+# re-runs only re-read files that changed. Client calls with no matching route are
+# reported, so a 404-then-fallback round-trip shows up here instead of in
+# production.
+#
+# Usage:
+#   python3 index_api_routes.py            # report unmatched client calls
+#   python3 index_api_routes.py --routes   # also list every server route
+#   python3 index_api_routes.py --strict   # exit 1 when any call is unmatched
+import json
+import os
+import re
+import sys
+
+from fold_api_calls import HELPER_NAME as AUTH_FETCH_HELPER
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.path.join(ROOT, '.route-index.json')
+CACHE_VERSION = 2
+
+SERVER_FILE = 'server-real-v3.js'
+EXPRESS_INDEX = 'server/index.js'
+EXPRESS_ROUTES_DIR = 'server/routes'
+CLIENT_DIR = 'public/static'
+
+HTTP_METHODS = 'get|post|put|patch|delete|all'
+APP_ROUTE_RE = re.compile(r"\bapp\.(" + HTTP_METHODS + r")\(\s*(['\"`])([^'\"`]+)\2")
+ROUTER_ROUTE_RE = re.compile(r"\brouter\.(" + HTTP_METHODS + r")\(\s*(['\"`])([^'\"`]+)\2")
+REQUIRE_ROUTE_RE = re.compile(r"const\s+(\w+)\s*=\s*require\(\s*['\"]\./routes/([\w-]+)['\"]\s*\)")
+MOUNT_RE = re.compile(r"app\.use\(\s*['\"]([^'\"]+)['\"]\s*,\s*(\w+)\s*\)")
+# The helper name comes from fold_api_calls.py, which writes those calls
+CLIENT_CALLS = ('fetch', 'apiCall', AUTH_FETCH_HELPER)
+CLIENT_CALL_RE = re.compile(r"\b(" + '|'.join(CLIENT_CALLS) + r")\(\s*(['\"`])([^'\"`]*)\2")
+TEMPLATE_EXPR_RE = re.compile(r"\$\{[^}]*\}")
+
+
+def line_of(content, offset):
+    return content.count('\n', 0, offset) + 1
+
+
+def normalize_path(path):
+    # Drop query/fragment, turn ${expr} into a wildcard segment marker
+    path = TEMPLATE_EXPR_RE.sub('*', path)
+    path = re.split(r'[?#]', path, 1)[0]
+    if len(path) > 1:
+        path = path.rstrip('/')
+    return path
+
+
+def join_mount(prefix, path):
+    if path == '/':
+        return prefix.rstrip('/') or '/'
+    return prefix.rstrip('/') + '/' + path.lstrip('/')
+
+
+def extract_app_routes(content):
+    return [
+        {'method': m.group(1).upper(), 'path': m.group(3), 'line': line_of(content, m.start())}
+        for m in APP_ROUTE_RE.finditer(content)
+    ]
+
+
+def extract_router_routes(content):
+    return [
+        {'method': m.group(1).upper(), 'path': m.group(3), 'line': line_of(content, m.start())}
+        for m in ROUTER_ROUTE_RE.finditer(content)
+    ]
+
+
+def extract_mounts(content):
+    modules = {var: name for var, name in REQUIRE_ROUTE_RE.findall(content)}
+    return {modules[var]: prefix for prefix, var in MOUNT_RE.findall(content) if var in modules}
+
+
+def extract_client_calls(content):
+    calls = []
+    for m in CLIENT_CALL_RE.finditer(content):
+        url = m.group(3)
+        # Only same-origin absolute paths; external APIs and dynamic URLs are skipped
+        if not url.startswith('/') or url.startswith('//'):
+            continue
+        calls.append({'kind': m.group(1), 'url': url, 'line': line_of(content, m.start())})
+    return calls
+
+
+def client_files():
+    base = os.path.join(ROOT, CLIENT_DIR)
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith('.js'):
+                yield os.path.relpath(os.path.join(dirpath, name), ROOT)
+
+
+def router_files():
+    base = os.path.join(ROOT, EXPRESS_ROUTES_DIR)
+    if not os.path.isdir(base):
+        return []
+    return [os.path.join(EXPRESS_ROUTES_DIR, n) for n in sorted(os.listdir(base)) if n.endswith('.js')]
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(files):
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+
+
+def scan(rel_path, extractor_name, cached, stats):
+    # Re-use the cached extraction when mtime and size are unchanged
+    abs_path = os.path.join(ROOT, rel_path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    key = [st.st_mtime_ns, st.st_size]
+    entry = cached.get(rel_path)
+    if entry and entry['key'] == key and entry['extractor'] == extractor_name:
+        stats['cached'] += 1
+        return entry
+    with open(abs_path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    stats['scanned'] += 1
+    return {'key': key, 'extractor': extractor_name, 'items': EXTRACTORS[extractor_name](content)}
+
+
+EXTRACTORS = {
+    'app': extract_app_routes,
+    'router': extract_router_routes,
+    'mounts': extract_mounts,
+    'client': extract_client_calls,
+}
+
+
+def build_index(use_cache=True):
+    """Return {'routes': [...], 'calls': [...], 'stats': {...}} for the tree."""
+    cached = load_cache() if use_cache else {}
+    files = {}
+    stats = {'scanned': 0, 'cached': 0}
+
+    def run(rel_path, extractor_name):
+        entry = scan(rel_path, extractor_name, cached, stats)
+        if entry is not None:
+            files[rel_path] = entry
+        return entry
+
+    routes = []
+    entry = run(SERVER_FILE, 'app')
+    if entry:
+        routes += [dict(r, file=SERVER_FILE) for r in entry['items']]
+
+    mounts_entry = run(EXPRESS_INDEX, 'mounts')
+    mounts = mounts_entry['items'] if mounts_entry else {}
+    for rel_path in router_files():
+        module = os.path.splitext(os.path.basename(rel_path))[0]
+        entry = run(rel_path, 'router')
+        if not entry:
+            continue
+        prefix = mounts.get(module)
+        for r in entry['items']:
+            path = join_mount(prefix, r['path']) if prefix else r['path']
+            routes.append(dict(r, path=path, file=rel_path, mounted=prefix is not None))
+
+    calls = []
+    for rel_path in client_files():
+        entry = run(rel_path, 'client')
+        if entry:
+            calls += [dict(c, file=rel_path) for c in entry['items']]
+
+    if use_cache:
+        save_cache(files)
+    return {'routes': routes, 'calls': calls, 'stats': stats}
+
+
+def route_matcher(routes):
+    # Index routes by segment count; ':param' and '*' segments match anything
+    by_len = {}
+    for r in routes:
+        segs = normalize_path(r['path']).split('/')
+        by_len.setdefault(len(segs), []).append((segs, r))
+
+    def match(path):
+        segs = normalize_path(path).split('/')
+        for route_segs, route in by_len.get(len(segs), []):
+            if all(a == b or a.startswith(':') or a == '*' or b == '*'
+                   for a, b in zip(route_segs, segs)):
+                return route
+        return None
+
+    return match
+
+
+def nearest_route(path, routes):
+    # Sibling route sharing the longest prefix of the last segment, to point
+    # at e.g. /api/dashboard/comprehensive-real for /api/dashboard/comprehensive
+    parent, _, leaf = normalize_path(path).rpartition('/')
+    best, best_len = None, 2
+    for r in routes:
+        r_parent, _, r_leaf = normalize_path(r['path']).rpartition('/')
+        if r_parent != parent:
+            continue
+        n = len(os.path.commonprefix([leaf, r_leaf]))
+        if n > best_len:
+            best, best_len = r, n
+    return best
+
+
+def cross_reference(index):
+    match = route_matcher(index['routes'])
+    unmatched = {}
+    for call in index['calls']:
+        url = call['url']
+        if match(url):
+            continue
+        # Some modules prepend an '/api' base URL before calling fetch()
+        if not url.startswith('/api/') and match('/api' + url):
+            continue
+        unmatched.setdefault(normalize_path(url), []).append(call)
+    return unmatched
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    index = build_index(use_cache='--no-cache' not in args)
+    stats = index['stats']
+    print(f"📇 Indexed {len(index['routes'])} server routes and {len(index['calls'])} client calls "
+          f"({stats['scanned']} files scanned, {stats['cached']} from cache)")
+
+    if '--routes' in args:
+        for r in sorted(index['routes'], key=lambda r: (r['path'], r['method'])):
+            print(f"   {r['method']:<6} {r['path']}  ({r['file']}:{r['line']})")
+
+    unmatched = cross_reference(index)
+    if not unmatched:
+        print("✅ Every client call has a matching server route")
+        sys.exit(0)
+
+    print(f"\n⚠️ {len(unmatched)} client endpoints have no server route:")
+    for path in sorted(unmatched):
+        calls = unmatched[path]
+        print(f"\n❌ {path}  ({len(calls)} call sites)")
+        near = nearest_route(path, index['routes'])
+        if not near and not path.startswith('/api/'):
+            near = nearest_route('/api' + path, index['routes'])
+        if near:
+            print(f"   ↳ closest route: {near['method']} {near['path']} ({near['file']}:{near['line']})")
+        for call in calls[:5]:
+            print(f"   {call['file']}:{call['line']}  {call['kind']}('{call['url']}')")
+        if len(calls) > 5:
+            print(f"   … and {len(calls) - 5} more")
+
+    sys.exit(1 if '--strict' in args else 0)
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# Minimal JavaScript span finder shared by the codemods
+#
+# The patch scripts locate code by regex anchors, which breaks as soon as a
+# brace or quote inside a template literal shifts. This walks the source with
+# just enough lexing (strings, template literals with nested ${}, comments
+# and regex literals) to match braces reliably and to list the methods of a
+# top-level class with their exact offsets.
+#
+# Top-level statements get names too ('GET /api/x', 'getCryptoPrices',
+# 'require ./utils/x'), so a line range in server-real-v3.js can be mapped
+# to the route or function it belongs to.
+#
+# Usage:
+#   python3 js_spans.py [path/to/app.js] [ClassName]   # list methods by size
+import collections
+import re
+import sys
+
+Member = collections.namedtuple('Member', 'name start params body_start end is_async kind')
+# start:      offset of the first header character (after indentation)
+# params:     text between the parentheses
+# body_start: offset of the opening '{'
+# end:        offset just past the closing '}'
+# kind:       'method', 'get', 'set', 'static' or 'generator'
+
+IDENT_RE = re.compile(r'[A-Za-z_$][\w$]*')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                  'delete', 'void', 'throw', 'instanceof', 'yield', 'await'}
+HEADER_RE = re.compile(
+    r'^(?P<static>static\s+)?(?P<async>async\s+)?(?P<star>\*\s*)?'
+    r'(?:(?P<accessor>get|set)\s+)?(?P<name>[A-Za-z_$][\w$]*)\s*$'
+)
+
+
+def _skip_quoted(src, i):
+    quote = src[i]
+    i += 1
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+        elif c == quote or c == '\n':
+            return i + 1
+        else:
+            i += 1
+    return i
+
+
+def _skip_template(src, i):
+    i += 1
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+        elif c == '`':
+            return i + 1
+        elif c == '$' and src.startswith('{', i + 1):
+            i = scan(src, i + 2, '}')
+        else:
+            i += 1
+    return i
+
+
+def _skip_regex(src, i):
+    i += 1
+    in_class = False
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return i
+        if in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '/':
+            i += 1
+            while i < len(src) and (src[i].isalnum() or src[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _regex_allowed(prev):
+    # A '/' starts a regex after an operator/opening token or keyword, not after a value
+    return prev == '' or prev in REGEX_KEYWORDS or (len(prev) == 1 and prev in '(,=:[!&|?{};+-*%<>~^}')
+
+
+def scan(src, i, closer=None):
+    """Walk code from i; return the offset just past the unmatched `closer`
+    (or len(src) when closer is None)."""
+    depth = 0
+    prev = ''
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c in ' \t\r\n':
+            i += 1
+        elif src.startswith('//', i):
+            end = src.find('\n', i)
+            i = n if end == -1 else end
+        elif src.startswith('/*', i):
+            end = src.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        elif c in '\'"':
+            i = _skip_quoted(src, i)
+            prev = 'value'
+        elif c == '`':
+            i = _skip_template(src, i)
+            prev = 'value'
+        elif c == '/' and _regex_allowed(prev):
+            i = _skip_regex(src, i)
+            prev = 'value'
+        elif c in '([{':
+            depth += 1
+            prev = c
+            i += 1
+        elif c in ')]}':
+            if depth == 0:
+                if closer is not None:
+                    return i + 1
+                prev = c
+                i += 1
+                continue
+            depth -= 1
+            prev = c
+            i += 1
+        else:
+            m = IDENT_RE.match(src, i)
+            if m:
+                prev = m.group(0)
+                i = m.end()
+            else:
+                prev = c
+                i += 1
+    return n
+
+
+def block_end(src, open_index):
+    """Offset just past the '}' matching the '{' at open_index."""
+    assert src[open_index] in '{(['
+    return scan(src, open_index + 1, '}')
+
+
+def skip_trivia(src, i, end=None):
+    # Whitespace, comments and stray semicolons between class members
+    end = len(src) if end is None else end
+    while i < end:
+        if src[i] in ' \t\r\n;':
+            i += 1
+        elif src.startswith('//', i):
+            nl = src.find('\n', i)
+            i = end if nl == -1 else nl
+        elif src.startswith('/*', i):
+            close = src.find('*/', i + 2)
+            i = end if close == -1 else close + 2
+        else:
+            break
+    return i
+
+
+def class_body(src, class_name):
+    """(open, close) offsets of the braces of a top-level `class Name {`."""
+    m = re.search(r'^class ' + re.escape(class_name) + r'\b[^{\n]*\{', src, re.MULTILINE)
+    if not m:
+        return None
+    open_index = m.end() - 1
+    return open_index, block_end(src, open_index) - 1
+
+
+def class_members(src, class_name='TitanApp'):
+    """List the methods of a top-level class in source order."""
+    body = class_body(src, class_name)
+    if not body:
+        return []
+    members = []
+    i = body[0] + 1
+    while True:
+        i = skip_trivia(src, i, body[1])
+        if i >= body[1]:
+            break
+        paren = src.find('(', i)
+        brace_or_semi = min(p for p in (src.find('{', i), src.find(';', i), body[1]) if p != -1)
+        m = HEADER_RE.match(src[i:paren]) if paren != -1 and paren < brace_or_semi else None
+        if not m:
+            # Class field or something unexpected: skip to the end of the statement
+            i = scan_statement_end(src, i, body[1])
+            continue
+        params_end = scan(src, paren + 1, ')')
+        body_start = skip_trivia(src, params_end)
+        end = block_end(src, body_start)
+        if m.group('static'):
+            kind = 'static'
+        elif m.group('star'):
+            kind = 'generator'
+        else:
+            kind = m.group('accessor') or 'method'
+        members.append(Member(m.group('name'), i, src[paren + 1:params_end - 1], body_start,
+                              end, bool(m.group('async')), kind))
+        i = end
+    return members
+
+
+def scan_statement_end(src, i, limit):
+    # Field initialisers may contain braces/arrows; stop at the first top-level ';' or newline member
+    depth = 0
+    while i < limit:
+        c = src[i]
+        if c in '\'"':
+            i = _skip_quoted(src, i)
+            continue
+        if c == '`':
+            i = _skip_template(src, i)
+            continue
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == ';' and depth <= 0:
+            return i + 1
+        i += 1
+    return limit
+
+
+def _continues(src, i):
+    # Does the code after a newline continue the previous statement?
+    j = skip_trivia(src, i)
+    if j >= len(src):
+        return False
+    if src[j] in '.?:+-*/%&|,=([<>':
+        return True
+    m = IDENT_RE.match(src, j)
+    return bool(m) and m.group(0) in ('instanceof', 'in', 'of')
+
+
+def statement_end(src, i):
+    """Offset just past the top-level statement starting at i."""
+    declaration = re.match(r'(?:export\s+)?(?:async\s+)?(?:function\b|class\b)', src[i:i + 40])
+    depth = 0
+    prev = ''
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c == '\n':
+            if depth == 0 and prev and prev not in '([{,=:?+-*/%&|!<>~^' and not _continues(src, i):
+                return i
+            i += 1
+        elif c in ' \t\r':
+            i += 1
+        elif src.startswith('//', i):
+            end = src.find('\n', i)
+            i = n if end == -1 else end
+        elif src.startswith('/*', i):
+            end = src.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        elif c in '\'"':
+            i = _skip_quoted(src, i)
+            prev = 'value'
+        elif c == '`':
+            i = _skip_template(src, i)
+            prev = 'value'
+        elif c == '/' and _regex_allowed(prev):
+            i = _skip_regex(src, i)
+            prev = 'value'
+        elif c in '([{':
+            depth += 1
+            prev = c
+            i += 1
+        elif c in ')]}':
+            depth -= 1
+            prev = c
+            i += 1
+            if depth == 0 and c == '}' and declaration:
+                return i
+        elif c == ';' and depth == 0:
+            return i + 1
+        else:
+            m = IDENT_RE.match(src, i)
+            if m:
+                prev = m.group(0)
+                i = m.end()
+            else:
+                prev = c
+                i += 1
+    return n
+
+
+ROUTE_RE = re.compile(r'''^(?:app|router)\.(get|post|put|patch|delete|use|all)\(\s*(['"`])([^'"`]+)\2''')
+FUNCTION_RE = re.compile(r'^(?:export\s+)?(?:async\s+)?function\s*\*?\s*([\w$]+)')
+REQUIRE_RE = re.compile(r'''^(?:const|let|var)\s+[^=]+=\s*require\(\s*(['"])([^'"]+)\1''')
+DECLARATION_RE = re.compile(r'^(?:export\s+)?(?:const|let|var|class)\s+([\w$]+)')
+
+
+def statement_name(text):
+    """'GET /api/x', 'getCryptoPrices', 'require ./utils/x', 'TitanApp', ..."""
+    m = ROUTE_RE.match(text)
+    if m:
+        return f"{m.group(1).upper()} {m.group(3)}"
+    m = REQUIRE_RE.match(text)
+    if m:
+        return f"require {m.group(2)}"
+    m = FUNCTION_RE.match(text) or DECLARATION_RE.match(text)
+    if m:
+        return m.group(1)
+    return ' '.join(text.split('\n', 1)[0].split())[:60]
+
+
+def top_level_spans(src):
+    """[(name, start, end)] for each top-level statement of a script."""
+    spans = []
+    i = 0
+    while True:
+        i = skip_trivia(src, i)
+        if i >= len(src):
+            break
+        end = max(statement_end(src, i), i + 1)
+        spans.append((statement_name(src[i:end]), i, end))
+        i = end
+    return spans
+
+
+def line_spans(src, class_name=None):
+    """[(name, first line, last line)] for top-level statements and, when
+    class_name is given, that class's methods (nested inside its span)."""
+    spans = [(name, line_of(src, start), line_of(src, end - 1))
+             for name, start, end in top_level_spans(src)]
+    if class_name:
+        spans += [(m.name, line_of(src, m.start), line_of(src, m.end - 1))
+                  for m in class_members(src, class_name)]
+    return spans
+
+
+def line_of(src, offset):
+    return src.count('\n', 0, offset) + 1
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else 'public/static/app.js'
+    class_name = sys.argv[2] if len(sys.argv) > 2 else 'TitanApp'
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    members = class_members(source, class_name)
+    for member in sorted(members, key=lambda m: m.start - m.end)[:40]:
+        print(f"{member.end - member.start:>8,}  {line_of(source, member.start):>6}  "
+              f"{'async ' if member.is_async else ''}{member.name}")
+    print(f"📊 {len(members)} members in {class_name}, "
+          f"{sum(m.end - m.start for m in members):,} bytes")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# Local CoinGecko stand-in for offline load tests
+#
+# Serves the two upstream endpoints the injected market routes depend on
+# (/api/v3/simple/price and /api/v3/global) with configurable latency,
+# error rate and rate limiting, and counts every upstream call so cache and
+# request-coalescing changes can be measured without touching
+# api.coingecko.com. Point the server at it with
+#   COINGECKO_API_URL=http://127.0.0.1:8900/api/v3
+#
+# Usage:
+#   python3 loadtests/coingecko_stub.py --port 8900 --latency 120 --jitter 60 \
+#       --error-rate 0.02 --rate-limit 50 --rate-window 60
+#
+# GET /__stats returns the call counters, GET /__reset clears them.
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import parse_qs, urlsplit
+
+BASE_PRICES = {
+    'bitcoin': 43250.0, 'ethereum': 2680.0, 'cardano': 0.52, 'polkadot': 7.1,
+    'chainlink': 14.6, 'ripple': 0.61, 'solana': 98.0, 'avalanche-2': 36.5,
+}
+
+STATUS_TEXT = {200: 'OK', 404: 'Not Found', 429: 'Too Many Requests', 500: 'Internal Server Error'}
+
+
+class CoinGeckoStub:
+    def __init__(self, latency_ms=80, jitter_ms=40, error_rate=0.0,
+                 rate_limit=0, rate_window=60.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.calls = {}
+        self.statuses = {}
+        self.ids_requested = 0
+        self.window_start = time.monotonic()
+        self.window_count = 0
+
+    def stats(self):
+        return {
+            'upstream_calls': sum(self.calls.values()),
+            'calls': dict(self.calls),
+            'statuses': {str(k): v for k, v in self.statuses.items()},
+            'ids_requested': self.ids_requested,
+        }
+
+    def rate_limited(self):
+        # Fixed window, like CoinGecko's per-minute public limit
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        if now - self.window_start >= self.rate_window:
+            self.window_start, self.window_count = now, 0
+        self.window_count += 1
+        return self.window_count > self.rate_limit
+
+    def price(self, coin_id):
+        base = BASE_PRICES.get(coin_id, 1.0 + (sum(map(ord, coin_id)) % 500) / 10)
+        return base * (1 + self.random.uniform(-0.002, 0.002))
+
+    def simple_price(self, query):
+        ids = [i for i in query.get('ids', [''])[0].split(',') if i]
+        self.ids_requested += len(ids)
+        body = {}
+        for coin_id in ids:
+            entry = {'usd': round(self.price(coin_id), 6)}
+            if query.get('include_24hr_change', ['false'])[0] == 'true':
+                entry['usd_24h_change'] = round(self.random.uniform(-6, 6), 4)
+            if query.get('include_market_cap', ['false'])[0] == 'true':
+                entry['usd_market_cap'] = round(entry['usd'] * 19_500_000, 2)
+            body[coin_id] = entry
+        return body
+
+    def global_data(self):
+        return {'data': {
+            'active_cryptocurrencies': 12000,
+            'total_market_cap': {'usd': 1.75e12 * (1 + self.random.uniform(-0.01, 0.01))},
+            'total_volume': {'usd': 8.5e10 * (1 + self.random.uniform(-0.05, 0.05))},
+            'market_cap_percentage': {'btc': 51.2, 'eth': 16.8},
+            'market_cap_change_percentage_24h_usd': round(self.random.uniform(-4, 4), 4),
+        }}
+
+    async def respond(self, path, query):
+        if path == '/__stats':
+            return 200, self.stats(), {}
+        if path == '/__reset':
+            self.reset()
+            return 200, {'reset': True}, {}
+
+        if not path.startswith('/api/v3/'):
+            return 404, {'error': 'not found'}, {}
+
+        self.calls[path] = self.calls.get(path, 0) + 1
+        delay = max(0.0, self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms))
+        await asyncio.sleep(delay / 1000)
+
+        if self.rate_limited():
+            return 429, {'status': {'error_code': 429, 'error_message': 'Rate limit exceeded'}}, \
+                {'Retry-After': str(int(self.rate_window))}
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 500, {'error': 'stub upstream error'}, {}
+        if path == '/api/v3/simple/price':
+            return 200, self.simple_price(query), {}
+        if path == '/api/v3/global':
+            return 200, self.global_data(), {}
+        return 404, {'error': 'not found'}, {}
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2:
+                return
+            url = urlsplit(parts[1])
+            status, body, headers = await self.respond(url.path, parse_qs(url.query))
+            if not url.path.startswith('/__'):
+                self.statuses[status] = self.statuses.get(status, 0) + 1
+
+            payload = json.dumps(body).encode('utf-8')
+            head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+                    'Content-Type: application/json',
+                    f'Content-Length: {len(payload)}',
+                    'Connection: close']
+            head += [f'{k}: {v}' for k, v in headers.items()]
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8900):
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def add_stub_arguments(parser):
+    parser.add_argument('--latency', type=float, default=80, help='mean upstream latency (ms)')
+    parser.add_argument('--jitter', type=float, default=40, help='+/- latency jitter (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of calls answered with 500')
+    parser.add_argument('--rate-limit', type=int, default=0, help='calls allowed per window (0 = unlimited)')
+    parser.add_argument('--rate-window', type=float, default=60.0, help='rate-limit window (s)')
+    parser.add_argument('--seed', type=int, default=None)
+
+
+def stub_from_args(args):
+    return CoinGeckoStub(args.latency, args.jitter, args.error_rate,
+                         args.rate_limit, args.rate_window, args.seed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Local CoinGecko stand-in')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = await stub_from_args(args).start(args.host, args.port)
+    print(f"🦎 CoinGecko stub listening on http://{args.host}:{args.port}/api/v3")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# Load-replay harness for /api/market/prices and /api/market/overview
+#
+# Replays a realistic request mix at a fixed target RPS (open loop, so a
+# slow server shows up as latency instead of a lower request rate) and
+# reports p50/p95/p99 latency, status codes, cache hit ratio and the number
+# of upstream CoinGecko calls, read from the stub's /__stats counters.
+#
+# The mix mirrors what dashboards send: the watchlist widget's fixed
+# BTC,ETH,ADA,DOT,LINK list, ad-hoc symbol subsets drawn with a Zipf-like
+# popularity skew, and market overview calls.
+#
+# Usage (server started with COINGECKO_API_URL=http://127.0.0.1:8900/api/v3):
+#   python3 loadtests/market_replay.py --target http://127.0.0.1:4000 \
+#       --spawn-stub 8900 --rps 50 --duration 30
+#
+# Cache hit ratio uses the server's X-Cache header when present, otherwise
+# it is estimated as 1 - upstream calls / replayed requests.
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from urllib.parse import urlsplit
+
+from coingecko_stub import add_stub_arguments, stub_from_args
+
+WATCHLIST = 'BTC,ETH,ADA,DOT,LINK'
+SYMBOLS = ['BTC', 'ETH', 'SOL', 'XRP', 'ADA', 'AVAX', 'DOT', 'LINK']
+
+DEFAULT_MIX = {'watchlist': 0.6, 'symbols': 0.25, 'overview': 0.15}
+
+
+def zipf_weights(n, s=1.1):
+    return [1 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def request_paths(mix, rng):
+    """Endless generator of request paths following the configured mix."""
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    symbol_weights = zipf_weights(len(SYMBOLS))
+    while True:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == 'watchlist':
+            yield f'/api/market/prices?symbols={WATCHLIST}'
+        elif kind == 'overview':
+            yield '/api/market/overview'
+        else:
+            picked = set(rng.choices(SYMBOLS, symbol_weights, k=rng.randint(1, 5)))
+            yield '/api/market/prices?symbols=' + ','.join(s for s in SYMBOLS if s in picked)
+
+
+async def http_get(base_url, path, timeout):
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write((f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n'
+                      'Accept: application/json\r\nConnection: close\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    head, _, body = raw.partition(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split()[1])
+    headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(':') for l in lines[1:])}
+    return status, headers, body
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+async def replay(target, rps, duration, mix, max_inflight, timeout, seed):
+    rng = random.Random(seed)
+    paths = request_paths(mix, rng)
+    results = []
+    inflight = asyncio.Semaphore(max_inflight)
+    dropped = 0
+
+    async def one(path):
+        async with inflight:
+            start = time.perf_counter()
+            try:
+                status, headers, _ = await http_get(target, path, timeout)
+            except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+                status, headers = 0, {}
+            results.append((path, status, headers.get('x-cache'), (time.perf_counter() - start) * 1000))
+
+    tasks = []
+    interval = 1 / rps
+    started = time.perf_counter()
+    for n in range(int(rps * duration)):
+        # Open-loop arrivals: schedule against the wall clock, not completions
+        delay = started + n * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if inflight.locked():
+            dropped += 1
+            continue
+        tasks.append(asyncio.create_task(one(next(paths))))
+    await asyncio.gather(*tasks)
+    return results, dropped, time.perf_counter() - started
+
+
+async def stub_stats(stub_url, path='__stats'):
+    try:
+        _, _, body = await http_get(stub_url, '/' + path, 5)
+        return json.loads(body)
+    except (OSError, ValueError, asyncio.TimeoutError):
+        return None
+
+
+def report(results, dropped, elapsed, upstream):
+    latencies = sorted(r[3] for r in results)
+    statuses = {}
+    for r in results:
+        statuses[r[1]] = statuses.get(r[1], 0) + 1
+    ok = statuses.get(200, 0) + statuses.get(304, 0)
+
+    print(f"\n📊 Replayed {len(results)} requests in {elapsed:.1f}s "
+          f"({len(results) / elapsed:.1f} req/s, {dropped} dropped at the in-flight cap)")
+    print(f"   Latency p50 {percentile(latencies, 50):.1f} ms | "
+          f"p95 {percentile(latencies, 95):.1f} ms | p99 {percentile(latencies, 99):.1f} ms | "
+          f"max {latencies[-1] if latencies else 0:.1f} ms")
+    print("   Status: " + ', '.join(f"{s or 'conn-error'}={c}" for s, c in sorted(statuses.items())))
+
+    tagged = [r for r in results if r[2]]
+    if tagged:
+        hits = sum(1 for r in tagged if r[2].upper().startswith('HIT'))
+        print(f"   Cache hit ratio: {hits / len(tagged):.1%} (X-Cache header)")
+    if upstream is not None:
+        calls = upstream['upstream_calls']
+        print(f"   Upstream calls: {calls} {upstream['calls']}")
+        if not tagged and ok:
+            print(f"   Cache hit ratio: {max(0.0, 1 - calls / ok):.1%} (estimated from upstream calls)")
+    else:
+        print("   Upstream calls: unknown (stub /__stats not reachable)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Replay market API load against a server')
+    parser.add_argument('--target', default='http://127.0.0.1:4000', help='server base URL')
+    parser.add_argument('--stub', default='http://127.0.0.1:8900', help='CoinGecko stub base URL')
+    parser.add_argument('--spawn-stub', type=int, metavar='PORT', help='run the stub in-process on PORT')
+    parser.add_argument('--rps', type=float, default=20)
+    parser.add_argument('--duration', type=float, default=30, help='seconds')
+    parser.add_argument('--mix', type=json.loads, default=DEFAULT_MIX,
+                        help='JSON weights, e.g. \'{"watchlist": 0.6, "symbols": 0.25, "overview": 0.15}\'')
+    parser.add_argument('--max-inflight', type=int, default=256)
+    parser.add_argument('--timeout', type=float, default=10)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn_stub:
+        server = await stub_from_args(args).start('127.0.0.1', args.spawn_stub)
+        args.stub = f'http://127.0.0.1:{args.spawn_stub}'
+        print(f"🦎 CoinGecko stub listening on {args.stub}/api/v3")
+
+    await stub_stats(args.stub, '__reset')
+    print(f"🚀 Replaying {args.rps:g} req/s for {args.duration:g}s against {args.target}")
+    results, dropped, elapsed = await replay(args.target, args.rps, args.duration, args.mix,
+                                             args.max_inflight, args.timeout, args.seed)
+    report(results, dropped, elapsed, await stub_stats(args.stub))
+
+    if server:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -43,6 +43,21 @@ class TitanApp {
         this.loadSavedTheme();
     }
 
+    /**
+     * Shared authenticated fetch - adds the bearer token and JSON content type.
+     * Returns the raw Response so call sites keep their .ok / .json() handling.
+     */
+    authFetch(url, options = {}) {
+        return fetch(url, {
+            ...options,
+            headers: {
+                'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
+                'Content-Type': 'application/json',
+                ...(options.headers || {})
+            }
+        });
+    }
+
     async initializeModuleLoader() {
         try {
             // Wait for moduleLoader to be available
@@ -4727,9 +4742,36 @@ class TitanApp {
 
         const visibleWidgets = this.dashboardLayout.widgets.filter(w => w.isVisible);
 
-        // Load widget data in parallel
-        const widgetPromises = visibleWidgets.map(widget => this.loadWidgetData(widget));
-        await Promise.all(widgetPromises);
+        // Load widget data in parallel, painting each widget as it arrives
+        await this.scheduleWidgetLoads(visibleWidgets);
+    }
+
+    async scheduleWidgetLoads(widgets, concurrency = this.widgetConcurrency || 6) {
+        const startedAt = performance.now();
+        const queue = [...widgets];
+        this.widgetTimings = {};
+
+        // Each runner pulls the next widget as soon as its previous one is painted
+        const runner = async () => {
+            while (queue.length) {
+                const widget = queue.shift();
+                const widgetStart = performance.now();
+                await this.loadWidgetData(widget);
+                this.widgetTimings[widget.id] = {
+                    type: widget.type,
+                    waitMs: Math.round(widgetStart - startedAt),
+                    durationMs: Math.round(performance.now() - widgetStart)
+                };
+            }
+        };
+
+        const runners = Array.from({ length: Math.min(concurrency, queue.length) }, runner);
+        await Promise.all(runners);
+
+        this.dashboardLoadMs = Math.round(performance.now() - startedAt);
+        document.dispatchEvent(new CustomEvent('titan:dashboard-loaded', {
+            detail: { totalMs: this.dashboardLoadMs, widgets: this.widgetTimings }
+        }));
     }
 
     async loadWidgetData(widget) {
@@ -4791,12 +4833,7 @@ class TitanApp {
     async renderPortfolioSummaryWidget(widget) {
         try {
             // Get real portfolio data from API
-            const fetchResponse = await fetch('/api/dashboard/comprehensive', {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
-                    'Content-Type': 'application/json'
-                }
-            });
+            const fetchResponse = await this.authFetch('/api/dashboard/comprehensive?sections=portfolio');
             
             if (!fetchResponse.ok) {
                 console.warn('Portfolio API failed');
@@ -4837,12 +4874,7 @@ class TitanApp {
     async renderMarketOverviewWidget(widget) {
         try {
             // Get real market data from API
-            const response = await fetch('/api/dashboard/comprehensive', {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
-                    'Content-Type': 'application/json'
-                }
-            });
+            const response = await this.authFetch('/api/dashboard/comprehensive?sections=market');
             const data = response.ok ? await response.json() : {};
             const marketData = data.data?.market || {
                 total_market_cap: 0,
@@ -5416,12 +5448,7 @@ class TitanApp {
 
         try {
             // Get real performance data from API
-            const response = await fetch('/api/portfolio/advanced', {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
-                    'Content-Type': 'application/json'
-                }
-            });
+            const response = await this.authFetch('/api/portfolio/advanced');
             const data = response.ok ? await response.json() : {};
             const performance = data.data?.performance || {};
             
@@ -5555,27 +5582,18 @@ class TitanApp {
     async getPerformanceHistory() {
         try {
             // Try to get real historical data from API
-            const response = await fetch('/api/portfolio/performance', {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
-                    'Content-Type': 'application/json'
-                }
-            });
+            const response = await this.authFetch('/api/dashboard/comprehensive?sections=performance');
             const data = response.ok ? await response.json() : {};
-            if (data.success && data.data?.history) {
-                return response.data.history;
+            const history = data.data?.performance?.history;
+            if (data.success && history?.length) {
+                return history;
             }
         } catch (error) {
             console.warn('Performance history API not available, using calculation from current data');
         }
         
         // Fallback: calculate from current portfolio data
-        const dashResponse = await fetch('/api/dashboard/comprehensive', {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('titan_auth_token')}`,
-                    'Content-Type': 'application/json'
-                }
-            });
+        const dashResponse = await this.authFetch('/api/dashboard/comprehensive?sections=portfolio');
         const data = dashResponse.ok ? await dashResponse.json() : {};
         const portfolio = data.data?.portfolio || {};
         const currentBalance = portfolio.totalBalance || 10000;
@@ -0,0 +1,46 @@
+// Generated by generate_precache_manifest.py - do not edit by hand.
+// Consumed by service-worker.js via importScripts().
+self.__PRECACHE_MANIFEST = [
+  {"url": "/", "revision": "2e9d1087"},
+  {"url": "/static/css/dashboard-v2.css", "revision": "1d625673"},
+  {"url": "/static/css/market-animations.css", "revision": "6ea49928"},
+  {"url": "/static/css/tailwind.c8db4b32.css", "revision": "c8db4b32"},
+  {"url": "/static/fix_login_button.js", "revision": "f5df57f4"},
+  {"url": "/static/icons/icon-192x192.svg", "revision": "476579ef"},
+  {"url": "/static/icons/icon-512x512.svg", "revision": "7b7e8552"},
+  {"url": "/static/icons/icon-72x72.svg", "revision": "a7f129c0"},
+  {"url": "/static/manifest.json", "revision": "d6b779b7"},
+  {"url": "/static/modules/ai-adapters.cd476956.js", "revision": "cd476956"},
+  {"url": "/static/modules/ai-agents/agent-01-technical-analysis.9f4e3084.js", "revision": "9f4e3084"},
+  {"url": "/static/modules/ai-agents/agent-02-risk-management.d389f3a2.js", "revision": "d389f3a2"},
+  {"url": "/static/modules/ai-agents/agent-03-sentiment-analysis.e0319b49.js", "revision": "e0319b49"},
+  {"url": "/static/modules/ai-agents/agent-04-portfolio-optimization.5e87caa1.js", "revision": "5e87caa1"},
+  {"url": "/static/modules/ai-agents/agent-05-market-making.270b96e9.js", "revision": "270b96e9"},
+  {"url": "/static/modules/ai-agents/agent-06-algorithmic-trading.43b56503.js", "revision": "43b56503"},
+  {"url": "/static/modules/ai-agents/agent-07-news-analysis.97a5453b.js", "revision": "97a5453b"},
+  {"url": "/static/modules/ai-agents/agent-08-hft.d705779a.js", "revision": "d705779a"},
+  {"url": "/static/modules/ai-agents/agent-09-quantitative-analysis.808c9747.js", "revision": "808c9747"},
+  {"url": "/static/modules/ai-agents/agent-10-macro-analysis.8ccb7c3a.js", "revision": "8ccb7c3a"},
+  {"url": "/static/modules/ai-agents/agent-12-risk-assessment.a7e07a0e.js", "revision": "a7e07a0e"},
+  {"url": "/static/modules/ai-agents/agent-13-compliance-regulatory.878d8d6a.js", "revision": "878d8d6a"},
+  {"url": "/static/modules/ai-management.86422546.js", "revision": "86422546"},
+  {"url": "/static/modules/alerts.ab657483.js", "revision": "ab657483"},
+  {"url": "/static/modules/app.f5839b97.js", "revision": "f5839b97"},
+  {"url": "/static/modules/dashboard-v2.js", "revision": "fd9a9367"},
+  {"url": "/static/modules/dashboard/dashboard-widgets-loader.js", "revision": "5f6ad508"},
+  {"url": "/static/modules/dashboard/init.js", "revision": "ccf88992"},
+  {"url": "/static/modules/dashboard/legacy-annotator.js", "revision": "eeb800c2"},
+  {"url": "/static/modules/dashboard/market-integration.js", "revision": "b17e29ec"},
+  {"url": "/static/modules/dashboard/services/adapters/chart.adapter.js", "revision": "1e55a53a"},
+  {"url": "/static/modules/dashboard/services/adapters/market.adapter.js", "revision": "44dd229c"},
+  {"url": "/static/modules/dashboard/services/adapters/mode.adapter.js", "revision": "f06dd684"},
+  {"url": "/static/modules/dashboard/services/adapters/monitoring.adapter.js", "revision": "c29240f1"},
+  {"url": "/static/modules/dashboard/services/adapters/movers.adapter.js", "revision": "f755dde5"},
+  {"url": "/static/modules/dashboard/services/adapters/overview.adapter.js", "revision": "562900f4"},
+  {"url": "/static/modules/dashboard/services/adapters/portfolio.adapter.js", "revision": "a6d7a4c7"},
+  {"url": "/static/modules/dashboard/services/api/http.js", "revision": "24420234"},
+  {"url": "/static/modules/dashboard/widgets-integration-loader.js", "revision": "7824c7ae"},
+  {"url": "/static/modules/dashboard/widgets-integration.js", "revision": "9da23be8"},
+  {"url": "/static/modules/module-loader.89cb3ab0.js", "revision": "247b5bc2"},
+  {"url": "/static/styles.css", "revision": "96c1b9d5"}
+];
@@ -3,6 +3,9 @@
 
 const CACHE_NAME = 'titan-trading-v1.0.0';
 const DYNAMIC_CACHE_NAME = 'titan-dynamic-v1.0.0';
+// Not versioned: entries survive worker updates and are refreshed per revision
+const PRECACHE_NAME = 'titan-precache';
+const REVISION_HEADER = 'X-Precache-Revision';
 
 // Assets to cache for offline functionality
 const STATIC_ASSETS = [
@@ -21,6 +24,18 @@ const STATIC_ASSETS = [
   'https://cdn.jsdelivr.net/npm/axios@1.6.0/dist/axios.min.js'
 ];
 
+// Precache manifest ({ url, revision } per asset) generated by
+// generate_precache_manifest.py; fall back to STATIC_ASSETS without revisions
+try {
+  importScripts('/static/precache-manifest.js');
+} catch (error) {
+  console.warn('⚠️ Service Worker: Precache manifest not available, using STATIC_ASSETS');
+}
+
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST ||
+  STATIC_ASSETS.filter(url => !url.startsWith('http')).map(url => ({ url, revision: null }));
+const PRECACHE_URLS = new Set(PRECACHE_MANIFEST.map(entry => entry.url));
+
 // API endpoints for dynamic caching
 const API_ENDPOINTS = [
   '/api/health',
@@ -38,11 +53,7 @@ self.addEventListener('install', (event) => {
   console.log('🚀 Service Worker: Installing...');
   
   event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => {
-        console.log('✅ Service Worker: Caching static assets');
-        return cache.addAll(STATIC_ASSETS.filter(url => !url.startsWith('http')));
-      })
+    precacheAssets()
       .then(() => {
         console.log('✅ Service Worker: Installation complete');
         return self.skipWaiting(); // Force activation
@@ -65,13 +76,14 @@ self.addEventListener('activate', (event) => {
       .then((cacheNames) => {
         return Promise.all(
           cacheNames.map((cacheName) => {
-            if (cacheName !== CACHE_NAME && cacheName !== DYNAMIC_CACHE_NAME) {
+            if (cacheName !== CACHE_NAME && cacheName !== DYNAMIC_CACHE_NAME && cacheName !== PRECACHE_NAME) {
               console.log('🗑️ Service Worker: Deleting old cache', cacheName);
               return caches.delete(cacheName);
             }
           })
         );
       })
+      .then(() => prunePrecache())
       .then(() => {
         console.log('✅ Service Worker: Activation complete');
         return self.clients.claim(); // Take control immediately
@@ -79,6 +91,145 @@ self.addEventListener('activate', (event) => {
   );
 });
 
+// Fetch only the manifest entries whose revision differs from the cached copy
+async function precacheAssets() {
+  const cache = await caches.open(PRECACHE_NAME);
+  let fetched = 0;
+
+  await Promise.all(PRECACHE_MANIFEST.map(async ({ url, revision }) => {
+    const cached = await cache.match(url);
+    if (cached && revision && cached.headers.get(REVISION_HEADER) === revision) {
+      return;
+    }
+
+    const response = await fetchWithDelta(url, { cache: 'reload' });
+    if (!response.ok) {
+      throw new Error(`Precache failed for ${url}: ${response.status}`);
+    }
+
+    const headers = new Headers(response.headers);
+    if (revision) {
+      headers.set(REVISION_HEADER, revision);
+    }
+    await cache.put(url, new Response(await response.blob(), {
+      status: response.status,
+      statusText: response.statusText,
+      headers
+    }));
+    fetched++;
+  }));
+
+  console.log(`✅ Service Worker: Precached ${fetched} changed assets, ${PRECACHE_MANIFEST.length - fetched} unchanged`);
+}
+
+// Drop precached assets that are no longer in the manifest
+async function prunePrecache() {
+  const cache = await caches.open(PRECACHE_NAME);
+  const wanted = new Set(PRECACHE_MANIFEST.map(entry => new URL(entry.url, self.location.origin).href));
+  const requests = await cache.keys();
+  await Promise.all(requests.filter(request => !wanted.has(request.url)).map(request => cache.delete(request)));
+}
+
+// =============================================================================
+// DELTA UPDATES FOR HASHED BUNDLES (see build_bundle_deltas.py)
+// =============================================================================
+
+const DELTA_INDEX_URL = '/static/deltas/index.json';
+const HASHED_BUNDLE_RE = /\/([\w-]+)\.([0-9a-f]{8})\.js$/;
+
+// Find a cached copy of an older build of the same bundle that has a delta
+async function findCachedBundle(name, deltas) {
+  for (const cacheName of [PRECACHE_NAME, CACHE_NAME]) {
+    const cache = await caches.open(cacheName);
+    for (const request of await cache.keys()) {
+      const match = new URL(request.url).pathname.match(HASHED_BUNDLE_RE);
+      if (match && match[1] === name && Object.prototype.hasOwnProperty.call(deltas, match[2])) {
+        return { hash: match[2], response: await cache.match(request) };
+      }
+    }
+  }
+  return null;
+}
+
+async function fetchJson(url, options) {
+  const response = await fetch(url, options);
+  if (!response.ok) {
+    throw new Error(`${url}: ${response.status}`);
+  }
+  return response.json();
+}
+
+// One delta index per worker: a deploy that publishes new deltas also ships
+// a new service worker (the precache manifest changes). A failed fetch is
+// remembered as "no deltas" so it is not retried for every hashed bundle.
+let deltaIndex = null;
+
+function loadDeltaIndex() {
+  if (!deltaIndex) {
+    deltaIndex = fetchJson(DELTA_INDEX_URL, { cache: 'no-cache' }).catch((error) => {
+      console.warn('⚠️ Service Worker: Delta index unavailable:', error);
+      return { bundles: {} };
+    });
+  }
+  return deltaIndex;
+}
+
+// Ops are [start, count] line copies from the old bundle or inserted text
+function applyDelta(oldText, delta) {
+  const oldLines = oldText.split('\n');
+  const lines = [];
+  for (const op of delta.ops) {
+    if (Array.isArray(op)) {
+      for (let i = op[0]; i < op[0] + op[1]; i++) {
+        lines.push(oldLines[i]);
+      }
+    } else {
+      lines.push(...op.split('\n'));
+    }
+  }
+  return lines.join('\n');
+}
+
+async function sha256Hex(text) {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// Rebuild a hashed bundle from a cached older build when a delta is published,
+// otherwise fall back to a normal network fetch
+async function fetchWithDelta(input, options) {
+  const { pathname } = new URL(typeof input === 'string' ? input : input.url, self.location.origin);
+  const match = pathname.match(HASHED_BUNDLE_RE);
+
+  if (match) {
+    try {
+      // Only a cached build with a published delta to this hash is usable
+      const index = await loadDeltaIndex();
+      const bundle = index.bundles && index.bundles[match[1]];
+      const base = bundle && bundle.hash === match[2] && bundle.deltas
+        ? await findCachedBundle(match[1], bundle.deltas)
+        : null;
+      if (base) {
+        const entry = bundle.deltas[base.hash];
+        const delta = await fetchJson(entry.url);
+        const text = applyDelta(await base.response.text(), delta);
+        if (await sha256Hex(text) === bundle.sha256) {
+          console.log(`⚡ Service Worker: Patched ${pathname} from ${base.hash} (${entry.size} of ${bundle.size} bytes)`);
+          return new Response(text, {
+            status: 200,
+            headers: { 'Content-Type': 'application/javascript; charset=utf-8' }
+          });
+        }
+        console.warn('⚠️ Service Worker: Delta checksum mismatch for', pathname);
+      }
+    } catch (error) {
+      console.warn('⚠️ Service Worker: Delta update failed, fetching full bundle:', error);
+    }
+  }
+
+  return fetch(input, options);
+}
+
 // =============================================================================
 // FETCH HANDLING (Network + Cache Strategy)
 // =============================================================================
@@ -148,6 +299,16 @@ async function handleApiRequest(request) {
 
 // Cache First Strategy (for static assets)
 async function handleStaticRequest(request) {
+  // Precached assets are keyed by path; ?v= cache busters don't matter here
+  const { pathname } = new URL(request.url);
+  if (PRECACHE_URLS.has(pathname)) {
+    const precache = await caches.open(PRECACHE_NAME);
+    const precachedResponse = await precache.match(pathname);
+    if (precachedResponse) {
+      return precachedResponse;
+    }
+  }
+
   const cachedResponse = await caches.match(request);
   
   if (cachedResponse) {
@@ -155,7 +316,7 @@ async function handleStaticRequest(request) {
   }
   
   try {
-    const networkResponse = await fetch(request);
+    const networkResponse = await fetchWithDelta(request);
     
     if (networkResponse.ok) {
       const cache = await caches.open(CACHE_NAME);
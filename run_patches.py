@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# Diff-scoped patch runner
+#
+# The add_*/fix_* scripts patch public/static/app.js and server-real-v3.js
+# in place, each by locating a method, route or marker. Re-evaluating all of
+# them on every commit costs time proportional to the repository. This
+# runner reads the changed line ranges from a plain `git diff -U0` between
+# two revisions, maps them to the spans they touch (TitanApp methods in
+# app.js, top-level routes/functions/requires in server-real-v3.js, see
+# js_spans.py) and evaluates only the patches whose anchors intersect those
+# spans, whose script (or helper) changed, or that depend on such a patch.
+#
+# Evaluation runs the selected patches, in registry order, on a scratch copy
+# of the targets taken from the newer revision, and reports per patch
+# whether it changed anything, was a no-op, or failed (non-zero exit, a
+# "❌" line in its output - the scripts report a missing anchor that way and
+# still exit 0 - or a patched target that no longer passes `node --check`).
+# An already-applied patch prints "⚠️"/"ℹ️" and counts as a no-op. Scripts
+# that write new files instead (split_app_bundle.py) declare output
+# directories; the JavaScript they write there is checked the same way, ES
+# modules with --input-type=module. The tree itself is never modified.
+#
+# Usage:
+#   python3 run_patches.py                        # HEAD -> working tree (pre-commit)
+#   python3 run_patches.py origin/main HEAD       # CI: commits in a range
+#   python3 run_patches.py --list [REV1 [REV2]]   # show the selection only
+#   python3 run_patches.py --all                  # evaluate every patch
+import collections
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from js_spans import line_spans
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = 'public/static/app.js'
+SERVER = 'server-real-v3.js'
+CLASS_NAMES = {APP: 'TitanApp'}
+
+Patch = collections.namedtuple('Patch', 'script anchors after inputs outputs', defaults=[()])
+# anchors: {target: [span names]}, '*' = any change to the target
+# after:   patches whose output this one anchors on
+# inputs:  other files the script imports or reads
+# outputs: directories the script writes generated JavaScript to
+
+PATCHES = [
+    # server-real-v3.js
+    Patch('fix_real_market_data.py', {SERVER: ['getMarketOverview']}, [], []),
+    Patch('add_crypto_prices_endpoint.py',
+          {SERVER: ['getMarketOverview', 'require ./utils/logMasking']},
+          ['fix_real_market_data.py'], ['data/symbol-registry.json']),
+    Patch('add_market_prices_api.py',
+          {SERVER: ['GET /api/dashboard/comprehensive-real', 'require ./utils/logMasking']},
+          ['add_crypto_prices_endpoint.py'], []),
+    # public/static/app.js
+    Patch('fix_all_api_calls.py', {APP: ['*']}, [], []),
+    Patch('fix_all_fetches.py', {APP: ['*']}, ['fix_all_api_calls.py'], []),
+    Patch('fix_response_json.py',
+          {APP: ['renderPortfolioSummaryWidget', 'renderMarketOverviewWidget']},
+          ['fix_all_api_calls.py'], []),
+    Patch('fix_frontend_mock.py', {APP: ['renderPortfolioSummaryWidget']}, [], []),
+    Patch('fix_market_widget.py', {APP: ['renderMarketOverviewWidget']}, [], []),
+    Patch('fix_watchlist_widget.py', {APP: ['renderWatchlistWidget']}, [], []),
+    Patch('fix_watchlist_with_fetch.py', {APP: ['renderWatchlistWidget']},
+          ['fix_watchlist_widget.py'], []),
+    Patch('fix_mock_method.py', {APP: ['generateMockPerformanceData', 'getPerformanceHistory']}, [], []),
+    Patch('fix_performance_chart.py',
+          {APP: ['initializeWidgetChart', 'generateMockPerformanceData', 'getPerformanceHistory']},
+          [], []),
+    Patch('fix_duplicate_data.py', {APP: ['getPerformanceHistory']}, ['fix_mock_method.py'], []),
+    Patch('safe_fix_widgets.py',
+          {APP: ['renderFearGreedWidget', 'renderTopMoversWidget', 'renderTradingSignalsWidget',
+                 'renderAIRecommendationsWidget']}, [], []),
+    Patch('fix_login_handler.py', {APP: ['setupEventListeners']}, [], []),
+    Patch('fold_api_calls.py', {APP: ['TitanApp']}, ['fix_all_api_calls.py'], []),
+    Patch('add_dashboard_scheduler.py', {APP: ['loadAllWidgets', 'loadWidgetData']}, [], []),
+    # both targets
+    Patch('add_dashboard_aggregator.py',
+          {SERVER: ['GET /api/dashboard/comprehensive-real', 'GET /api/dashboard/comprehensive',
+                    'require ./utils/logMasking'],
+           APP: ['renderPortfolioSummaryWidget', 'renderMarketOverviewWidget', 'getPerformanceHistory']},
+          ['fix_response_json.py', 'fix_duplicate_data.py', 'fold_api_calls.py'], []),
+    Patch('add_price_stream.py',
+          {SERVER: ['GET /api/market/prices', 'require hono/cors', 'require ./utils/logMasking'],
+           APP: ['renderWatchlistWidget', 'initializeModuleLoader']},
+          ['add_market_prices_api.py', 'fix_watchlist_with_fetch.py'], ['js_spans.py']),
+]
+# Splits whatever app.js the patches above leave behind, so it runs last
+PATCHES.append(Patch('split_app_bundle.py', {APP: ['*']}, [p.script for p in PATCHES if APP in p.anchors],
+                     ['js_spans.py', 'public/index.html'], ['public/static/modules']))
+
+HUNK_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+ESM_RE = re.compile(r'^(?:import|export)\s', re.MULTILINE)
+
+
+def git(*args):
+    return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def read_revision(path, rev):
+    """File contents at `rev`, or the working tree when rev is None."""
+    if rev is None:
+        try:
+            with open(os.path.join(ROOT, path), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return ''
+    try:
+        return git('show', f'{rev}:{path}')
+    except subprocess.CalledProcessError:
+        return ''
+
+
+def changed_ranges(rev1, rev2, paths):
+    """{path: ([old (first, last)], [new (first, last)])} from `git diff -U0`."""
+    args = ['diff', '-U0', '--no-color', '--no-ext-diff', rev1] + ([rev2] if rev2 else []) + ['--'] + paths
+    ranges = {}
+    current = None
+    for line in git(*args).splitlines():
+        if line.startswith('+++ '):
+            current = line[6:] if line.startswith('+++ b/') else None
+            if current:
+                ranges.setdefault(current, ([], []))
+        elif current and line.startswith('@@'):
+            m = HUNK_RE.match(line)
+            old_start, old_len = int(m.group(1)), int(m.group(2) or 1)
+            new_start, new_len = int(m.group(3)), int(m.group(4) or 1)
+            # A zero-length side still "touches" the line it sits next to
+            ranges[current][0].append((old_start, old_start + max(old_len, 1) - 1))
+            ranges[current][1].append((new_start, new_start + max(new_len, 1) - 1))
+    # Deleted files show up as '+++ /dev/null'; record them by their old name
+    for line in git('diff', '--name-status', '--no-renames', rev1, *([rev2] if rev2 else []), '--', *paths).splitlines():
+        status, path = line.split('\t', 1)
+        if status == 'D':
+            ranges.setdefault(path, ([(1, 1)], []))
+    return ranges
+
+
+def touched_spans(source, ranges, class_name):
+    spans = line_spans(source, class_name)
+    return {name for name, first, last in spans
+            for start, end in ranges if first <= end and start <= last}
+
+
+def select(rev1, rev2):
+    """Return ({script: reason}, {target: touched span names})."""
+    targets = sorted({t for p in PATCHES for t in p.anchors})
+    watched = sorted(set(targets) | {p.script for p in PATCHES} |
+                     {i for p in PATCHES for i in p.inputs} | {'js_spans.py'})
+    ranges = changed_ranges(rev1, rev2, watched)
+
+    touched = {}
+    for target in targets:
+        if target not in ranges:
+            continue
+        old_ranges, new_ranges = ranges[target]
+        class_name = CLASS_NAMES.get(target)
+        touched[target] = (touched_spans(read_revision(target, rev1), old_ranges, class_name) |
+                           touched_spans(read_revision(target, rev2), new_ranges, class_name))
+
+    selected = {}
+    for patch in PATCHES:
+        if patch.script in ranges:
+            selected[patch.script] = 'script changed'
+            continue
+        changed_inputs = [i for i in patch.inputs if i in ranges]
+        if changed_inputs:
+            selected[patch.script] = f"input changed: {', '.join(changed_inputs)}"
+            continue
+        for target, anchors in patch.anchors.items():
+            if target not in touched:
+                continue
+            hits = sorted(set(anchors) & touched[target]) or (['*'] if '*' in anchors else [])
+            if hits:
+                selected[patch.script] = f"{target}: {', '.join(hits)}"
+                break
+
+    # Patches anchored on the output of a selected patch are re-evaluated too
+    for patch in PATCHES:
+        if patch.script not in selected:
+            upstream = [a for a in patch.after if a in selected]
+            if upstream:
+                selected[patch.script] = f"after {', '.join(upstream)}"
+    return selected, touched
+
+
+def node_check(path):
+    if shutil.which('node') is None:
+        return True, ''
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    if ESM_RE.search(source):
+        # `node --check file.js` does not reliably reject broken ES modules
+        result = subprocess.run(['node', '--input-type=module', '--check'], input=source,
+                                capture_output=True, text=True)
+    else:
+        result = subprocess.run(['node', '--check', path], capture_output=True, text=True)
+    lines = result.stderr.strip().splitlines()
+    # Newer node versions end stderr with a 'Node.js vX' footer
+    errors = [line for line in lines if 'Error' in line] or lines
+    return result.returncode == 0, errors[0] if errors else ''
+
+
+def output_files(workdir, outputs):
+    """{relative path: contents} of the .js files under the output directories."""
+    files = {}
+    for output in outputs:
+        for dirpath, _, filenames in os.walk(os.path.join(workdir, output)):
+            for filename in filenames:
+                if filename.endswith('.js'):
+                    path = os.path.relpath(os.path.join(dirpath, filename), workdir)
+                    files[path] = read_revision(os.path.join(workdir, path), None)
+    return files
+
+
+def evaluate(scripts, rev2):
+    """Run `scripts` in order on a scratch copy; return [(script, status, seconds, detail)]."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix='titan-patches-') as workdir:
+        files = {t for p in PATCHES for t in p.anchors} | {i for p in PATCHES for i in p.inputs}
+        files |= {p.script for p in PATCHES} | {'js_spans.py'}
+        for path in files:
+            dest = os.path.join(workdir, path)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            # Scripts/helpers come from the same revision as the targets
+            with open(dest, 'w', encoding='utf-8') as f:
+                f.write(read_revision(path, rev2))
+
+        for patch in PATCHES:
+            if patch.script not in scripts:
+                continue
+            before = {t: read_revision(os.path.join(workdir, t), None) for t in patch.anchors}
+            before.update(output_files(workdir, patch.outputs))
+            started = time.perf_counter()
+            run = subprocess.run([sys.executable, patch.script], cwd=workdir, capture_output=True, text=True)
+            elapsed = time.perf_counter() - started
+            changed = [t for t in patch.anchors if read_revision(os.path.join(workdir, t), None) != before[t]]
+            written = sorted(path for path, text in output_files(workdir, patch.outputs).items()
+                             if before.get(path) != text)
+
+            misses = [line.strip() for line in run.stdout.splitlines() if line.lstrip().startswith('❌')]
+            if run.returncode != 0:
+                detail = (misses or run.stderr.strip().splitlines() or ['exit ' + str(run.returncode)])[-1]
+                results.append((patch.script, 'failed', elapsed, detail))
+                continue
+            if misses:
+                results.append((patch.script, 'failed', elapsed, misses[-1]))
+                continue
+            broken = []
+            for target in changed + written:
+                ok, error = node_check(os.path.join(workdir, target))
+                if not ok:
+                    broken.append(f"{target}: {error}")
+            if broken:
+                results.append((patch.script, 'failed', elapsed, '; '.join(broken)))
+            elif changed or written:
+                outputs = [f"{len(written)} files in {', '.join(patch.outputs)}"] if written else []
+                results.append((patch.script, 'changed', elapsed, ', '.join(changed + outputs)))
+            else:
+                last = run.stdout.strip().splitlines()
+                results.append((patch.script, 'no-op', elapsed, last[-1] if last else ''))
+    return results
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    rev1 = args[0] if args else 'HEAD'
+    rev2 = args[1] if len(args) > 1 else None
+
+    started = time.perf_counter()
+    if '--all' in sys.argv:
+        selected = {p.script: 'all' for p in PATCHES}
+    else:
+        selected, touched = select(rev1, rev2)
+        label = f"{rev1}..{rev2 or 'working tree'}"
+        if not touched and not selected:
+            print(f"✅ {label}: no patch targets or scripts changed")
+            sys.exit(0)
+        print(f"🔍 {label}")
+        for target, names in sorted(touched.items()):
+            shown = sorted(names)
+            print(f"   {target}: {len(shown)} spans touched"
+                  + (f" ({', '.join(shown[:8])}{', ...' if len(shown) > 8 else ''})" if shown else ''))
+
+    print(f"\n📋 {len(selected)}/{len(PATCHES)} patches selected")
+    for patch in PATCHES:
+        if patch.script in selected:
+            print(f"   • {patch.script:<32} {selected[patch.script]}")
+
+    if '--list' in sys.argv or not selected:
+        sys.exit(0)
+
+    results = evaluate(selected, rev2)
+    print()
+    icons = {'changed': '✅', 'no-op': '➖', 'failed': '❌'}
+    for script, status, elapsed, detail in results:
+        print(f"{icons[status]} {script:<32} {status:<8} {elapsed * 1000:6.0f} ms  {detail}")
+
+    failed = sum(1 for r in results if r[1] == 'failed')
+    print(f"\n📊 {len(results)} evaluated, {failed} failed in {time.perf_counter() - started:.1f}s")
+    sys.exit(1 if failed else 0)
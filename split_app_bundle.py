@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# Split the monolithic TitanApp bundle into lazily loaded method chunks
+#
+# public/static/app.js is one ~450 KB class that every visitor downloads and
+# parses before the login form works. This codemod moves the dashboard
+# render*Widget methods and the rarely used sections (theme, widget library,
+# trading mode, profile, admin users) into hashed ES modules under
+# public/static/modules/lazy/ that are fetched with import() on first use.
+#
+# Per chunk, using js_spans.py for exact method offsets:
+#   - async methods referenced outside the chunk keep a small stub in the
+#     class that loads the chunk and forwards the call
+#   - methods only referenced from inside the chunk are moved without a stub
+#   - sync methods referenced from outside stay in the class (a stub would
+#     turn their return value into a Promise)
+# A loaded chunk installs its methods on TitanApp.prototype, so later calls
+# skip the stub. public/static/app.js stays the source the patch scripts
+# edit; the split bundle is written as modules/app.<md5[:8]>.js next to the
+# chunk files, and the initial payload before/after is reported.
+#
+# Usage:
+#   python3 split_app_bundle.py                  # write the split bundle + chunks
+#   python3 split_app_bundle.py --dry-run        # report only
+#   python3 split_app_bundle.py --update-html    # also point index.html at the split bundle
+import gzip
+import hashlib
+import os
+import re
+import sys
+
+from js_spans import class_body, class_members, line_of
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'public', 'static')
+SOURCE = os.path.join(STATIC_DIR, 'app.js')
+BUNDLE_DIR = os.path.join(STATIC_DIR, 'modules')
+CHUNK_DIR = os.path.join(BUNDLE_DIR, 'lazy')
+ENTRY_HTML = os.path.join(ROOT, 'public', 'index.html')
+CLASS_NAME = 'TitanApp'
+LOADER_NAME = 'loadLazyChunk'
+LOADER_ANCHOR = '    async initializeModuleLoader() {'
+
+WIDGET_METHOD_RE = re.compile(r'^render(\w+)Widget$')
+# Section marker comment -> chunk name
+SECTION_CHUNKS = {
+    'THEME CUSTOMIZATION': 'theme',
+    'WIDGET LIBRARY': 'widget-library',
+    'TRADING MODE TOGGLE SYSTEM': 'trading-mode',
+    'PROFILE MANAGEMENT': 'profile',
+    'ADMIN USERS MANAGEMENT': 'admin-users',
+}
+SECTION_RE = re.compile(r'^    // ===== (.+?) =====[ \t]*$', re.MULTILINE)
+HASHED_APP_RE = re.compile(r'^app(\.[0-9a-f]{8})?\.js$')
+
+LOADER_CODE = f'''    /**
+     * Load a lazily split method chunk (see split_app_bundle.py) once and
+     * install its methods on {CLASS_NAME}.prototype in place of the stubs.
+     */
+    {LOADER_NAME}(url) {{
+        const chunks = {CLASS_NAME}.lazyChunks || ({CLASS_NAME}.lazyChunks = new Map());
+        if (!chunks.has(url)) {{
+            chunks.set(url, import(url).then(module => {{
+                const descriptors = Object.getOwnPropertyDescriptors(module.methods);
+                for (const [name, descriptor] of Object.entries(descriptors)) {{
+                    Object.defineProperty({CLASS_NAME}.prototype, name, {{ ...descriptor, enumerable: false }});
+                }}
+                return module.methods;
+            }}).catch(error => {{
+                chunks.delete(url);
+                throw error;
+            }}));
+        }}
+        return chunks.get(url);
+    }}
+
+'''
+
+
+def kebab(name):
+    # AIRecommendations -> ai-recommendations
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '-', name).lower()
+
+
+def size(text):
+    return len(text.encode('utf-8'))
+
+
+def short_hash(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
+
+
+def gzip_size(text):
+    return len(gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0))
+
+
+def static_url(path):
+    return '/static/' + os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+
+
+def other_sources():
+    # Code outside app.js that may call TitanApp methods (window.app.xxx, onclick="app.xxx()")
+    texts = []
+    for dirpath, _, filenames in os.walk(os.path.join(ROOT, 'public')):
+        if os.path.abspath(dirpath).startswith(CHUNK_DIR):
+            continue
+        for filename in filenames:
+            if HASHED_APP_RE.match(filename) or not filename.endswith(('.js', '.html')):
+                continue
+            with open(os.path.join(dirpath, filename), 'r', encoding='utf-8', errors='ignore') as f:
+                texts.append(f.read())
+    return '\n'.join(texts)
+
+
+def leading_comment_start(source, member):
+    # Start of the comment block directly above a member (no blank line between)
+    line_start = source.rfind('\n', 0, member.start) + 1
+    start = line_start
+    while start > 0:
+        prev_start = source.rfind('\n', 0, start - 1) + 1
+        line = source[prev_start:start].strip()
+        if not line.startswith(('//', '/*', '*')) or SECTION_RE.match(source[prev_start:start - 1]):
+            break
+        start = prev_start
+    return start
+
+
+def assign_chunks(source, members):
+    """{chunk name: [members]} before the external-reference check."""
+    counts = {}
+    for member in members:
+        counts[member.name] = counts.get(member.name, 0) + 1
+    eligible = [m for m in members
+                if m.kind == 'method' and m.name != 'constructor' and counts[m.name] == 1]
+
+    chunks = {}
+    for member in eligible:
+        m = WIDGET_METHOD_RE.match(member.name)
+        if m and member.is_async:
+            chunks['widget-' + kebab(m.group(1))] = [member]
+
+    body_end = class_body(source, CLASS_NAME)[1]
+    sections = list(SECTION_RE.finditer(source))
+    taken = {m.name for group in chunks.values() for m in group}
+    for i, marker in enumerate(sections):
+        chunk = SECTION_CHUNKS.get(marker.group(1).strip())
+        if not chunk:
+            continue
+        end = sections[i + 1].start() if i + 1 < len(sections) else body_end
+        group = [m for m in eligible if marker.end() < m.start < end and m.name not in taken]
+        if group:
+            chunks[chunk] = group
+    return chunks
+
+
+def plan(source, members, external_text):
+    """Decide per chunk which members move and which need a stub."""
+    chunks = assign_chunks(source, members)
+    moved = {name: list(group) for name, group in chunks.items()}
+
+    def referenced_outside(member, group):
+        pattern = re.compile(r'(?<![\w$])' + re.escape(member.name) + r'(?![\w$])')
+        if pattern.search(external_text):
+            return True
+        spans = sorted((m.start, m.end) for m in group)
+        pos = 0
+        for start, end in spans + [(len(source), len(source))]:
+            if pattern.search(source, pos, start):
+                return True
+            pos = end
+        return False
+
+    # Keeping a sync method in the class makes its references external too: iterate
+    changed = True
+    while changed:
+        changed = False
+        for name, group in moved.items():
+            for member in list(group):
+                if not member.is_async and referenced_outside(member, group):
+                    group.remove(member)
+                    changed = True
+
+    result = {}
+    for name, group in moved.items():
+        if group:
+            stubs = [m for m in group if referenced_outside(m, group)]
+            result[name] = (group, stubs)
+    return result
+
+
+def chunk_module(name, source, group):
+    parts = []
+    for member in group:
+        text = source[leading_comment_start(source, member):member.end]
+        if not text.startswith('    '):
+            text = '    ' + text.lstrip(' ')
+        parts.append(text)
+    return (f"// {CLASS_NAME} lazy chunk '{name}' - generated from public/static/app.js\n"
+            f"// by split_app_bundle.py; edit app.js and re-run instead of editing this file.\n"
+            f"export const methods = {{\n\n" + ',\n\n'.join(parts) + '\n};\n')
+
+
+def stub_code(member, url):
+    return (f"async {member.name}(...args) {{\n"
+            f"        const methods = await this.{LOADER_NAME}('{url}');\n"
+            f"        return methods.{member.name}.apply(this, args);\n"
+            f"    }}")
+
+
+def split(source, external_text):
+    """Return (split bundle, {chunk path: module text}, plan)."""
+    if f'{LOADER_NAME}(url)' in source:
+        raise SystemExit("❌ Source is already split")
+    if LOADER_ANCHOR not in source:
+        raise SystemExit(f"❌ Could not find loader insertion point: {LOADER_ANCHOR.strip()}")
+
+    members = class_members(source, CLASS_NAME)
+    chunk_plan = plan(source, members, external_text)
+
+    edits = []   # (start, end, replacement)
+    modules = {}
+    for name, (group, stubs) in chunk_plan.items():
+        text = chunk_module(name, source, group)
+        path = os.path.join(CHUNK_DIR, f'{name}.{short_hash(text)}.js')
+        modules[path] = text
+        url = static_url(path)
+        for member in group:
+            if member in stubs:
+                edits.append((member.start, member.end, stub_code(member, url)))
+            else:
+                # Drop the method, its doc comment and the blank line after it
+                start = leading_comment_start(source, member)
+                end = member.end
+                if source.startswith('\n\n', end):
+                    end += 1
+                edits.append((start, end + 1, ''))
+
+    out = source
+    for start, end, replacement in sorted(edits, reverse=True):
+        out = out[:start] + replacement + out[end:]
+    out = out.replace(LOADER_ANCHOR, LOADER_CODE + LOADER_ANCHOR, 1)
+    return out, modules, chunk_plan
+
+
+def update_html(bundle_url):
+    with open(ENTRY_HTML, 'r', encoding='utf-8') as f:
+        html = f.read()
+    new_html, count = re.subn(r'/static/modules/app\.[0-9a-f]{8}\.js', bundle_url, html)
+    if count:
+        with open(ENTRY_HTML, 'w', encoding='utf-8') as f:
+            f.write(new_html)
+    return count
+
+
+if __name__ == '__main__':
+    dry_run = '--dry-run' in sys.argv
+
+    with open(SOURCE, 'r', encoding='utf-8') as f:
+        source = f.read()
+    print(f"Original file size: {size(source):,} bytes")
+
+    bundle, modules, chunk_plan = split(source, other_sources())
+    bundle_path = os.path.join(BUNDLE_DIR, f'app.{short_hash(bundle)}.js')
+
+    for path, text in modules.items():
+        name = os.path.basename(path).rsplit('.', 2)[0]
+        group, stubs = chunk_plan[name]
+        print(f"   📦 {static_url(path)}: {len(group)} methods, {len(stubs)} stubs, "
+              f"{size(text):,} bytes (first at line {line_of(source, group[0].start)})")
+        if not stubs:
+            print(f"      ⚠️ Nothing outside the chunk calls these methods (dead code?)")
+
+    lazy_total = sum(size(t) for t in modules.values())
+    before, after = size(source), size(bundle)
+    before_gz, after_gz = gzip_size(source), gzip_size(bundle)
+    print(f"\n📊 Initial payload: {before:,} → {after:,} bytes parsed "
+          f"({(before - after) / before:.1%} less), gzip {before_gz:,} → {after_gz:,} bytes")
+    print(f"   Lazy chunks: {len(modules)} files, {lazy_total:,} bytes loaded on first use")
+
+    if dry_run:
+        print("⚠️ Dry run, nothing written")
+        sys.exit(0)
+
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    for path, text in modules.items():
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    with open(bundle_path, 'w', encoding='utf-8') as f:
+        f.write(bundle)
+    print(f"✅ Wrote {static_url(bundle_path)} and {len(modules)} chunks")
+
+    if '--update-html' in sys.argv:
+        if update_html(static_url(bundle_path)):
+            print(f"✅ index.html now loads {static_url(bundle_path)}")
+        else:
+            print("⚠️ No hashed app bundle reference found in index.html")
@@ -0,0 +1,113 @@
+/**
+ * Conditional JSON Tests
+ * Tests for ETag / If-None-Match handling on polled JSON routes
+ */
+
+const zlib = require('zlib');
+const { sendConditionalJson, etagMatches, pickEncoding } = require('../utils/conditionalJson');
+
+function assertEqual(actual, expected, testName) {
+  if (JSON.stringify(actual) === JSON.stringify(expected)) {
+    console.log(`✅ ${testName}`);
+    return true;
+  } else {
+    console.log(`❌ ${testName}`);
+    console.log(`   Expected: ${JSON.stringify(expected)}`);
+    console.log(`   Actual:   ${JSON.stringify(actual)}`);
+    return false;
+  }
+}
+
+// Minimal stand-in for a Hono context
+function mockContext(headers = {}) {
+  return {
+    req: { header: (name) => headers[name] },
+    body: (body, status, responseHeaders) => ({ body, status, headers: responseHeaders })
+  };
+}
+
+function runTests() {
+  console.log('🧪 Running Conditional JSON Tests\n');
+  console.log('=' .repeat(60) + '\n');
+
+  const results = [];
+  const prices = { BTC: { symbol: 'BTC', current_price: 43250 } };
+
+  // Test 1: First response carries a strong ETag
+  console.log('Test 1: Strong ETag\n');
+  const first = sendConditionalJson(mockContext(), 'test:prices', prices);
+  const etag = first.headers.ETag;
+  results.push(assertEqual(first.status, 200, 'First request returns 200'));
+  results.push(assertEqual(/^"[^"]+"$/.test(etag), true, 'ETag is strong (no W/ prefix)'));
+  results.push(assertEqual(JSON.parse(first.body).data, prices, 'Body carries the payload'));
+  console.log('');
+
+  // Test 2: Same payload, same bytes
+  console.log('Test 2: Stable Representation\n');
+  const again = sendConditionalJson(mockContext(), 'test:prices', { ...prices });
+  results.push(assertEqual(again.headers.ETag, etag, 'Equal payload keeps the ETag'));
+  results.push(assertEqual(again.body.equals(first.body), true, 'Body bytes (incl. timestamp) are identical'));
+  console.log('');
+
+  // Test 3: If-None-Match
+  console.log('Test 3: Conditional GET\n');
+  const notModified = sendConditionalJson(mockContext({ 'If-None-Match': etag }), 'test:prices', prices);
+  results.push(assertEqual(notModified.status, 304, 'Matching If-None-Match returns 304'));
+  results.push(assertEqual(notModified.body, null, '304 has no body'));
+  results.push(assertEqual(etagMatches(`"other", W/${etag}`, etag), true, 'Weak and listed validators match'));
+  const changed = sendConditionalJson(mockContext({ 'If-None-Match': etag }), 'test:prices',
+    { BTC: { symbol: 'BTC', current_price: 43300 } });
+  results.push(assertEqual(changed.status, 200, 'Changed payload returns 200'));
+  results.push(assertEqual(changed.headers.ETag !== etag, true, 'Changed payload gets a new ETag'));
+  console.log('');
+
+  // Test 4: Precompressed bodies
+  console.log('Test 4: Compression\n');
+  const gz1 = sendConditionalJson(mockContext({ 'Accept-Encoding': 'gzip, deflate' }), 'test:prices', prices);
+  const gz2 = sendConditionalJson(mockContext({ 'Accept-Encoding': 'gzip, deflate' }), 'test:prices', prices);
+  results.push(assertEqual(gz1.headers['Content-Encoding'], 'gzip', 'gzip when accepted'));
+  results.push(assertEqual(gz1.body === gz2.body, true, 'Compressed body reused on cache hit'));
+  results.push(assertEqual(JSON.parse(zlib.gunzipSync(gz1.body)).data, prices, 'gzip body decodes'));
+  const br = sendConditionalJson(mockContext({ 'Accept-Encoding': 'gzip, br' }), 'test:prices', prices);
+  results.push(assertEqual(br.headers['Content-Encoding'], 'br', 'Brotli preferred when accepted'));
+  console.log('');
+
+  // Test 5: One ETag per representation
+  console.log('Test 5: Encoding Variants\n');
+  results.push(assertEqual(gz1.headers.ETag, etag.replace(/"$/, '-gz"'), 'gzip body has its own ETag'));
+  results.push(assertEqual(br.headers.ETag, etag.replace(/"$/, '-br"'), 'Brotli body has its own ETag'));
+  const gzRevalidated = sendConditionalJson(
+    mockContext({ 'If-None-Match': gz1.headers.ETag }), 'test:prices', prices);
+  results.push(assertEqual(gzRevalidated.status, 304, 'Identity request matches a cached gzip ETag'));
+  results.push(assertEqual(etagMatches(br.headers.ETag, etag), true, 'Any encoding variant matches'));
+  console.log('');
+
+  // Test 6: Accept-Encoding q-values
+  console.log('Test 6: Accept-Encoding q-values\n');
+  results.push(assertEqual(pickEncoding('gzip, br;q=0'), 'gzip', 'br;q=0 is not accepted'));
+  results.push(assertEqual(pickEncoding('gzip;q=1.0, br;q=0.5'), 'gzip', 'Higher q-value wins'));
+  results.push(assertEqual(pickEncoding('*;q=0.5'), 'br', 'Wildcard covers unlisted codings'));
+  results.push(assertEqual(pickEncoding('identity'), null, 'No compression when not accepted'));
+  console.log('');
+
+  // Test 7: extra is part of the version
+  console.log('Test 7: Extra Fields\n');
+  const plain = sendConditionalJson(mockContext(), 'test:extra', prices);
+  const withExtra = sendConditionalJson(mockContext(), 'test:extra', prices, { extra: { source: 'cache' } });
+  results.push(assertEqual(withExtra.headers.ETag !== plain.headers.ETag, true, 'Changed extra gets a new ETag'));
+  results.push(assertEqual(JSON.parse(withExtra.body).source, 'cache', 'Body carries the extra fields'));
+  console.log('');
+
+  const passed = results.filter(Boolean).length;
+  const failed = results.length - passed;
+
+  // Summary
+  console.log('=' .repeat(60));
+  console.log(`\n📊 Results: ${passed} passed, ${failed} failed\n`);
+
+  return passed > 0 && failed === 0;
+}
+
+// Run tests
+const success = runTests();
+process.exit(success ? 0 : 1);
@@ -0,0 +1,147 @@
+/**
+ * Price Stream Tests
+ * Tests for the shared price poller and changed-only SSE fan-out
+ */
+
+const { PriceStream } = require('../utils/priceStream');
+
+function assertEqual(actual, expected, testName) {
+  if (JSON.stringify(actual) === JSON.stringify(expected)) {
+    console.log(`✅ ${testName}`);
+    return true;
+  } else {
+    console.log(`❌ ${testName}`);
+    console.log(`   Expected: ${JSON.stringify(expected)}`);
+    console.log(`   Actual:   ${JSON.stringify(actual)}`);
+    return false;
+  }
+}
+
+const quote = (symbol, price) => ({ symbol, current_price: price, price_change_percentage_24h: 1 });
+
+async function runTests() {
+  console.log('🧪 Running Price Stream Tests\n');
+  console.log('=' .repeat(60) + '\n');
+
+  const results = [];
+  const market = { BTC: 43250, ETH: 2280, ADA: 0.52 };
+  const upstreamCalls = [];
+
+  const stream = new PriceStream({
+    intervalMs: 60000,
+    fetchPrices: async (symbols) => {
+      upstreamCalls.push(symbols);
+      const quotes = {};
+      for (const symbol of symbols) {
+        if (symbol in market) quotes[symbol] = quote(symbol, market[symbol]);
+      }
+      return quotes;
+    }
+  });
+
+  const eventsA = [];
+  const eventsB = [];
+  const settle = () => new Promise(resolve => setImmediate(resolve));
+
+  // Test 1: Subscribe sends a snapshot
+  console.log('Test 1: Snapshot On Subscribe\n');
+  const unsubscribeA = stream.subscribe(['btc', 'ETH'], (event, data) => eventsA.push([event, data]));
+  await settle();
+  results.push(assertEqual(eventsA.map(e => e[0]), ['snapshot'], 'First event is a snapshot'));
+  results.push(assertEqual(Object.keys(eventsA[0][1]), ['BTC', 'ETH'], 'Snapshot covers the subscribed symbols'));
+  const unsubscribeB = stream.subscribe(['BTC'], (event, data) => eventsB.push([event, data]));
+  await settle();
+  results.push(assertEqual(upstreamCalls.length, 1, 'Known symbols are served without polling'));
+  console.log('');
+
+  // Test 2: One poll for all clients, changed symbols only
+  console.log('Test 2: Changed-Only Fan-Out\n');
+  market.ETH = 2300;
+  await stream.poll();
+  results.push(assertEqual(upstreamCalls.length, 2, 'One upstream call per poll regardless of clients'));
+  results.push(assertEqual(eventsA[1], ['prices', { ETH: quote('ETH', 2300) }], 'Only the changed symbol is sent'));
+  results.push(assertEqual(eventsB.length, 1, 'Client not watching ETH gets nothing'));
+  await stream.poll();
+  results.push(assertEqual(eventsA.length, 2, 'Unchanged poll sends nothing'));
+  console.log('');
+
+  // Test 3: Symbol union and shutdown
+  console.log('Test 3: Subscriptions\n');
+  results.push(assertEqual(stream.watchedSymbols().sort(), ['BTC', 'ETH'], 'Polls the union of symbols'));
+  stream.subscribe(['ADA'], () => { throw new Error('connection closed'); });
+  await settle();
+  results.push(assertEqual(stream.getStats().clients, 2, 'Failing client is dropped'));
+  unsubscribeA();
+  unsubscribeB();
+  results.push(assertEqual(stream.getStats().running, false, 'Poller stops without subscribers'));
+  console.log('');
+
+  // Test 4: Symbols the upstream never returns
+  console.log('Test 4: Unknown Symbols\n');
+  upstreamCalls.length = 0;
+  const unsubscribers = [];
+  for (let i = 0; i < 21; i++) {
+    unsubscribers.push(stream.subscribe(['BTC', 'NOTACOIN'], () => {}));
+    await settle();
+  }
+  results.push(assertEqual(upstreamCalls.length, 1, 'Unknown ticker is polled on demand only once'));
+  unsubscribers.forEach(unsubscribe => unsubscribe());
+
+  let failingCalls = 0;
+  const failing = new PriceStream({
+    intervalMs: 60000,
+    fetchPrices: async () => { failingCalls++; return {}; }
+  });
+  const failingClients = [];
+  for (let i = 0; i < 5; i++) {
+    failingClients.push(failing.subscribe(['BTC'], () => {}));
+    await settle();
+  }
+  results.push(assertEqual(failingCalls, 1, 'Empty upstream result does not trigger a poll per client'));
+  failingClients.forEach(unsubscribe => unsubscribe());
+  console.log('');
+
+  // Test 5: maxSymbols
+  console.log('Test 5: Symbol Cap\n');
+  const capped = new PriceStream({ intervalMs: 60000, maxSymbols: 2, fetchPrices: async () => ({}) });
+  const cappedEvents = [];
+  const unsubscribeCapped = capped.subscribe(['BTC', 'ETH', 'ADA'], (event, data) => cappedEvents.push([event, data]));
+  await settle();
+  results.push(assertEqual(cappedEvents[0], ['rejected', { symbols: ['ADA'], maxSymbols: 2 }],
+    'Symbols past maxSymbols are rejected explicitly'));
+  results.push(assertEqual(capped.watchedSymbols(), ['BTC', 'ETH'], 'Accepted symbols are all polled'));
+  unsubscribeCapped();
+  console.log('');
+
+  // Test 6: Unwatched symbols are forgotten
+  console.log('Test 6: Pruning And Resume\n');
+  upstreamCalls.length = 0;
+  const unsubscribeBtc = stream.subscribe(['BTC'], () => {});
+  const unsubscribeEth = stream.subscribe(['ETH'], () => {});
+  await settle();
+  unsubscribeEth();
+  results.push(assertEqual([...stream.snapshot.keys()], ['BTC'], 'Symbol nobody watches is pruned'));
+  unsubscribeBtc();
+  results.push(assertEqual([stream.snapshot.size, stream.polled.size], [0, 0], 'Idle poller keeps no symbols'));
+  market.BTC = 44000;
+  upstreamCalls.length = 0;
+  const resumed = [];
+  const unsubscribeResumed = stream.subscribe(['BTC'], (event, data) => resumed.push([event, data]));
+  await settle();
+  results.push(assertEqual(upstreamCalls.length, 1, 'Resuming from idle polls once right away'));
+  results.push(assertEqual(resumed, [['snapshot', { BTC: quote('BTC', 44000) }]], 'Snapshot after idle is fresh'));
+  unsubscribeResumed();
+  console.log('');
+
+  const passed = results.filter(Boolean).length;
+  const failed = results.length - passed;
+
+  // Summary
+  console.log('=' .repeat(60));
+  console.log(`\n📊 Results: ${passed} passed, ${failed} failed\n`);
+
+  return passed > 0 && failed === 0;
+}
+
+// Run tests
+runTests().then(success => process.exit(success ? 0 : 1));
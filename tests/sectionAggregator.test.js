@@ -0,0 +1,120 @@
+/**
+ * Section Aggregator Tests
+ * Tests for per-section caching, subsets and partial results
+ */
+
+const { createSectionAggregator, parseSections } = require('../utils/sectionAggregator');
+
+function assertEqual(actual, expected, testName) {
+  if (JSON.stringify(actual) === JSON.stringify(expected)) {
+    console.log(`✅ ${testName}`);
+    return true;
+  } else {
+    console.log(`❌ ${testName}`);
+    console.log(`   Expected: ${JSON.stringify(expected)}`);
+    console.log(`   Actual:   ${JSON.stringify(actual)}`);
+    return false;
+  }
+}
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+async function runTests() {
+  console.log('🧪 Running Section Aggregator Tests\n');
+  console.log('=' .repeat(60) + '\n');
+
+  const results = [];
+  const calls = { portfolio: 0, market: 0, performance: 0 };
+  let marketDelay = 0;
+  let performanceFails = false;
+
+  const aggregator = createSectionAggregator({
+    portfolio: {
+      ttlMs: 30000,
+      perUser: true,
+      load: async ({ userId }) => { calls.portfolio++; return { userId, totalBalance: 1000 }; }
+    },
+    market: {
+      ttlMs: 30000,
+      load: async () => { calls.market++; await sleep(marketDelay); return { btc_dominance: 52 }; }
+    },
+    performance: {
+      ttlMs: 0,
+      perUser: true,
+      load: async () => {
+        calls.performance++;
+        if (performanceFails) throw new Error('db down');
+        return { history: [] };
+      }
+    }
+  }, { timeoutMs: 50 });
+
+  // Test 1: sections= parsing
+  console.log('Test 1: Section Selection\n');
+  const known = ['portfolio', 'market'];
+  results.push(assertEqual(parseSections('', known).names, known, 'Empty query selects defaults'));
+  results.push(assertEqual(parseSections(' Market,market,foo', known),
+    { names: ['market'], unknown: ['foo'] }, 'Trims, lowercases, dedupes and reports unknown'));
+  const subset = await aggregator.collect({ userId: 1 }, 'market');
+  results.push(assertEqual(Object.keys(subset.data), ['market'], 'Only requested sections are loaded'));
+  results.push(assertEqual(calls.portfolio, 0, 'Unrequested section loader not called'));
+  console.log('');
+
+  // Test 2: Per-section cache
+  console.log('Test 2: Per-Section TTL\n');
+  await aggregator.collect({ userId: 1 });
+  const second = await aggregator.collect({ userId: 1 });
+  results.push(assertEqual(second.sections.portfolio.status, 'cached', 'Portfolio served from cache within TTL'));
+  results.push(assertEqual(second.sections.performance.status, 'fresh', 'Zero-TTL section reloaded'));
+  results.push(assertEqual(calls.market, 1, 'Shared market section loaded once'));
+  await aggregator.collect({ userId: 2 }, ['portfolio']);
+  results.push(assertEqual(calls.portfolio, 2, 'Per-user sections cached per user'));
+  console.log('');
+
+  // Test 3: Slow section -> partial result
+  console.log('Test 3: Partial Results\n');
+  aggregator.clear();
+  marketDelay = 120;
+  const startedAt = Date.now();
+  const partial = await aggregator.collect({ userId: 1 });
+  results.push(assertEqual(Date.now() - startedAt < 110, true, 'Response does not wait for the slow section'));
+  results.push(assertEqual(partial.sections.market.status, 'timeout', 'Slow section reported as timeout'));
+  results.push(assertEqual(partial.data.portfolio.totalBalance, 1000, 'Other sections still returned'));
+  results.push(assertEqual(partial.complete, false, 'Result flagged incomplete'));
+  await sleep(100);
+  const later = await aggregator.collect({ userId: 1 }, 'market');
+  results.push(assertEqual(later.sections.market.status, 'cached', 'Background load fills the cache'));
+  console.log('');
+
+  // Test 4: Errors and stale fallback
+  console.log('Test 4: Errors\n');
+  performanceFails = true;
+  const failed = await aggregator.collect({ userId: 1 }, 'performance');
+  results.push(assertEqual(failed.sections.performance.status, 'stale', 'Failed reload serves expired value'));
+  results.push(assertEqual(failed.sections.performance.error, 'db down', 'Error message reported'));
+  const fresh = await aggregator.collect({ userId: 3 }, 'performance');
+  results.push(assertEqual([fresh.sections.performance.status, fresh.data.performance], ['error', null],
+    'Failed load without cache returns null'));
+  console.log('');
+
+  // Test 5: Single flight
+  console.log('Test 5: Shared In-Flight Loads\n');
+  aggregator.clear();
+  marketDelay = 20;
+  const before = calls.market;
+  await Promise.all([aggregator.collect({}, 'market'), aggregator.collect({}, 'market')]);
+  results.push(assertEqual(calls.market - before, 1, 'Concurrent requests share one load'));
+  console.log('');
+
+  const passed = results.filter(Boolean).length;
+  const failedCount = results.length - passed;
+
+  // Summary
+  console.log('=' .repeat(60));
+  console.log(`\n📊 Results: ${passed} passed, ${failedCount} failed\n`);
+
+  return passed > 0 && failedCount === 0;
+}
+
+// Run tests
+runTests().then(success => process.exit(success ? 0 : 1));
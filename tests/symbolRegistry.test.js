@@ -0,0 +1,83 @@
+/**
+ * Symbol Registry Tests
+ * Tests for the shared symbol <-> CoinGecko id lookups
+ */
+
+const {
+  loadRegistry,
+  symbolToCoinId,
+  isKnownSymbol,
+  coinIdToSymbol,
+  coinName,
+  registrySize
+} = require('../utils/symbolRegistry');
+
+function assertEqual(actual, expected, testName) {
+  if (JSON.stringify(actual) === JSON.stringify(expected)) {
+    console.log(`✅ ${testName}`);
+    return true;
+  } else {
+    console.log(`❌ ${testName}`);
+    console.log(`   Expected: ${JSON.stringify(expected)}`);
+    console.log(`   Actual:   ${JSON.stringify(actual)}`);
+    return false;
+  }
+}
+
+function runTests() {
+  console.log('🧪 Running Symbol Registry Tests\n');
+  console.log('=' .repeat(60) + '\n');
+
+  const results = [];
+
+  // Test 1: Registry loaded at require time
+  console.log('Test 1: Registry Loading\n');
+  results.push(assertEqual(registrySize() > 8, true, 'Registry has more than the old 8 symbols'));
+  console.log('');
+
+  // Test 2: Symbol -> id
+  console.log('Test 2: Symbol Lookup\n');
+  results.push(assertEqual(symbolToCoinId('BTC'), 'bitcoin', 'BTC -> bitcoin'));
+  results.push(assertEqual(symbolToCoinId('avax'), 'avalanche-2', 'avax (lowercase) -> avalanche-2'));
+  results.push(assertEqual(symbolToCoinId(' link '), 'chainlink', 'Shared ticker LINK resolves to chainlink'));
+  results.push(assertEqual(symbolToCoinId('NOTACOIN'), 'notacoin', 'Unknown symbol passes through lowercased'));
+  results.push(assertEqual([isKnownSymbol(' eth '), isKnownSymbol('NOTACOIN')], [true, false],
+    'isKnownSymbol only accepts registry tickers'));
+  console.log('');
+
+  // Test 3: Id -> symbol
+  console.log('Test 3: Id Lookup\n');
+  results.push(assertEqual(coinIdToSymbol('avalanche-2'), 'AVAX', 'avalanche-2 -> AVAX'));
+  results.push(assertEqual(coinIdToSymbol('bitcoin-cash'), 'BCH', 'bitcoin-cash -> BCH (not BIT)'));
+  results.push(assertEqual(
+    coinIdToSymbol('some-new-coin') !== coinIdToSymbol('some-other-coin'),
+    true,
+    'Unknown ids do not collide'
+  ));
+  results.push(assertEqual(coinName('binancecoin'), 'BNB', 'Display name from snapshot'));
+  console.log('');
+
+  // Test 4: Missing registry file
+  console.log('Test 4: Missing Registry\n');
+  const originalWarn = console.warn;
+  console.warn = () => {};
+  results.push(assertEqual(loadRegistry('/nonexistent/registry.json'), 0, 'Missing file loads nothing'));
+  console.warn = originalWarn;
+  results.push(assertEqual(symbolToCoinId('ETH'), 'eth', 'Falls back to raw ids'));
+  loadRegistry();
+  results.push(assertEqual(symbolToCoinId('ETH'), 'ethereum', 'Reload restores registry'));
+  console.log('');
+
+  const passed = results.filter(Boolean).length;
+  const failed = results.length - passed;
+
+  // Summary
+  console.log('=' .repeat(60));
+  console.log(`\n📊 Results: ${passed} passed, ${failed} failed\n`);
+
+  return passed > 0 && failed === 0;
+}
+
+// Run tests
+const success = runTests();
+process.exit(success ? 0 : 1);
@@ -0,0 +1,143 @@
+/**
+ * Conditional JSON Responses
+ * Strong ETags, If-None-Match -> 304 and precompressed bodies for polled
+ * JSON routes (market prices/overview, dashboard sections).
+ *
+ * Each route key keeps the last serialized envelope. While the payload
+ * version (a hash of the data, or the same cached object) is unchanged the
+ * exact same bytes - including the original `timestamp` - are re-served,
+ * so the ETag stays strong and gzip/brotli bodies are compressed only once.
+ *
+ * Each encoding of a version is a different representation, so it gets its
+ * own ETag ("v", "v-gz", "v-br"); If-None-Match accepts any of them.
+ */
+
+const crypto = require('crypto');
+const zlib = require('zlib');
+
+const MAX_ENTRIES = 500;
+
+const entries = new Map();         // route key -> serialized entry
+const versions = new WeakMap();    // cached data object -> version
+const ETAG_SUFFIXES = { gzip: '-gz', br: '-br' };
+
+function payloadVersion(data) {
+  // Cache hits usually hand back the same object, skip re-hashing it
+  if (data && typeof data === 'object' && versions.has(data)) {
+    return versions.get(data);
+  }
+  const version = crypto.createHash('sha1').update(JSON.stringify(data)).digest('base64url').slice(0, 22);
+  if (data && typeof data === 'object') {
+    versions.set(data, version);
+  }
+  return version;
+}
+
+function getEntry(key, data, extra) {
+  // extra is part of the body, so it is part of the version too
+  const version = Object.keys(extra).length > 0
+    ? payloadVersion([payloadVersion(data), extra])
+    : payloadVersion(data);
+  let entry = entries.get(key);
+  if (!entry || entry.version !== version) {
+    const body = Buffer.from(JSON.stringify({
+      success: true,
+      data,
+      ...extra,
+      timestamp: new Date().toISOString()
+    }));
+    entry = { version, body, gzip: null, br: null };
+    entries.delete(key);
+    entries.set(key, entry);
+    if (entries.size > MAX_ENTRIES) {
+      entries.delete(entries.keys().next().value);
+    }
+  }
+  return entry;
+}
+
+function etagFor(version, encoding) {
+  return `"${version}${ETAG_SUFFIXES[encoding] || ''}"`;
+}
+
+/**
+ * True when If-None-Match lists the identity `etag` or any encoding
+ * variant of it
+ */
+function etagMatches(ifNoneMatch, etag) {
+  if (!ifNoneMatch) return false;
+  const version = etag.replace(/^W\//, '').replace(/^"|"$/g, '');
+  const variants = [null, ...Object.keys(ETAG_SUFFIXES)].map(encoding => etagFor(version, encoding));
+  return ifNoneMatch.split(',').some(tag => {
+    const value = tag.trim();
+    return value === '*' || variants.includes(value.replace(/^W\//, ''));
+  });
+}
+
+/**
+ * Best of br/gzip by Accept-Encoding q-value (br on ties); `q=0` means
+ * not acceptable, `*` covers codings that are not listed.
+ */
+function pickEncoding(acceptEncoding = '') {
+  const weights = {};
+  for (const part of acceptEncoding.split(',')) {
+    const [name, ...params] = part.trim().toLowerCase().split(';');
+    if (!name) continue;
+    const q = params.map(p => p.trim()).find(p => p.startsWith('q='));
+    weights[name] = q ? parseFloat(q.slice(2)) || 0 : 1;
+  }
+  const weight = (name) => (name in weights ? weights[name] : weights['*'] || 0);
+
+  let best = null;
+  for (const encoding of ['br', 'gzip']) {
+    if (weight(encoding) > 0 && (!best || weight(encoding) > weight(best))) {
+      best = encoding;
+    }
+  }
+  return best;
+}
+
+function encodedBody(entry, encoding) {
+  if (encoding === 'br') {
+    entry.br = entry.br || zlib.brotliCompressSync(entry.body, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 5 }
+    });
+    return entry.br;
+  }
+  if (encoding === 'gzip') {
+    entry.gzip = entry.gzip || zlib.gzipSync(entry.body, { level: 6 });
+    return entry.gzip;
+  }
+  return entry.body;
+}
+
+/**
+ * Send `{ success, data, ...extra, timestamp }` with a strong ETag.
+ * Answers 304 when If-None-Match matches, otherwise the (compressed) body.
+ */
+function sendConditionalJson(c, key, data, { extra = {}, isPrivate = false } = {}) {
+  const entry = getEntry(key, data, extra);
+  const encoding = pickEncoding(c.req.header('Accept-Encoding'));
+  const headers = {
+    'ETag': etagFor(entry.version, encoding),
+    'Cache-Control': `${isPrivate ? 'private' : 'public'}, no-cache`,
+    'Vary': 'Accept-Encoding'
+  };
+
+  if (etagMatches(c.req.header('If-None-Match'), etagFor(entry.version))) {
+    return c.body(null, 304, headers);
+  }
+
+  if (encoding) {
+    headers['Content-Encoding'] = encoding;
+  }
+  headers['Content-Type'] = 'application/json; charset=UTF-8';
+  return c.body(encodedBody(entry, encoding), 200, headers);
+}
+
+module.exports = {
+  sendConditionalJson,
+  payloadVersion,
+  etagMatches,
+  pickEncoding
+};
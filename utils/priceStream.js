@@ -0,0 +1,229 @@
+/**
+ * Price Stream
+ * One shared price poller fanned out to any number of subscribers (SSE).
+ *
+ * Every open dashboard used to poll /api/market/prices on its own, so
+ * upstream (CoinGecko) load grew with the number of users. PriceStream polls
+ * once per interval for the union of subscribed symbols, compares the result
+ * with the last snapshot and pushes only the changed quotes to the clients
+ * that watch them. The poller only runs while someone is subscribed, and
+ * polls right away when it resumes from idle.
+ *
+ * A subscriber only triggers an immediate poll for symbols that no poll has
+ * covered yet; tickers the upstream does not know, or that failed to load,
+ * wait for the regular interval like everything else. Symbols nobody
+ * watches any more are dropped from the snapshot, so memory is bounded by
+ * the watched set and a resumed poller never serves an old quote as live.
+ *
+ * Events sent to a client:
+ * - snapshot: all known quotes for its symbols (on subscribe)
+ * - prices:   quotes that changed since the previous poll
+ * - rejected: symbols dropped because the poller is at maxSymbols
+ */
+
+const { logger } = require('./logMasking');
+
+class PriceStream {
+  /**
+   * @param {Object} options - Configuration options
+   * @param {Function} options.fetchPrices - async (symbols) => { SYMBOL: quote }
+   * @param {number} options.intervalMs - Poll interval (default: 15000ms)
+   * @param {number} options.maxSymbols - Cap on polled symbols (default: 100)
+   */
+  constructor(options = {}) {
+    this.fetchPrices = options.fetchPrices;
+    this.intervalMs = options.intervalMs || 15000;
+    this.maxSymbols = options.maxSymbols || 100;
+
+    this.clients = new Set();
+    this.snapshot = new Map(); // 'BTC' -> quote
+    this.polled = new Set();   // symbols included in a completed poll
+    this.timer = null;
+    this.polling = null;
+
+    this.metrics = {
+      polls: 0,
+      failedPolls: 0,
+      eventsSent: 0
+    };
+  }
+
+  /**
+   * Subscribe to `symbols`; send(event, data) receives the events.
+   * Returns an unsubscribe function.
+   */
+  subscribe(symbols, send) {
+    const requested = new Set(symbols.map(s => String(s).trim().toUpperCase()).filter(Boolean));
+    const watched = new Set(this.watchedSymbols());
+    const accepted = new Set();
+    const rejected = [];
+    for (const symbol of requested) {
+      if (watched.has(symbol) || watched.size < this.maxSymbols) {
+        watched.add(symbol);
+        accepted.add(symbol);
+      } else {
+        rejected.push(symbol);
+      }
+    }
+
+    const client = { symbols: accepted, send, ready: false };
+    this.clients.add(client);
+    this.start();
+    if (rejected.length > 0) {
+      this.deliver(client, 'rejected', { symbols: rejected, maxSymbols: this.maxSymbols });
+    }
+
+    const sendSnapshot = () => {
+      if (!this.clients.has(client)) return;
+      client.ready = true;
+      this.deliver(client, 'snapshot', this.quotesFor(client.symbols));
+    };
+
+    const unpolled = () => [...client.symbols].some(symbol => !this.polled.has(symbol));
+    if (unpolled()) {
+      // Never-polled symbols join the shared poll right away instead of waiting a
+      // full interval; a poll already in flight may predate them, so check again
+      this.poll()
+        .then(() => (unpolled() ? this.poll() : null))
+        .then(sendSnapshot, sendSnapshot);
+    } else {
+      sendSnapshot();
+    }
+
+    return () => this.unsubscribe(client);
+  }
+
+  unsubscribe(client) {
+    if (!this.clients.delete(client)) return;
+    const watched = new Set(this.watchedSymbols());
+    for (const symbol of client.symbols) {
+      if (!watched.has(symbol)) this.forget(symbol);
+    }
+    if (this.clients.size === 0) {
+      this.stop();
+    }
+  }
+
+  forget(symbol) {
+    this.polled.delete(symbol);
+    this.snapshot.delete(symbol);
+  }
+
+  start() {
+    if (this.timer) return;
+    this.timer = setInterval(() => {
+      this.poll().catch(() => {});
+    }, this.intervalMs);
+    if (this.timer.unref) this.timer.unref();
+    // Resuming from idle: nothing in the snapshot is current any more
+    this.poll().catch(() => {});
+  }
+
+  stop() {
+    clearInterval(this.timer);
+    this.timer = null;
+    this.polled.clear();
+    this.snapshot.clear();
+  }
+
+  /**
+   * Union of all subscribed symbols
+   */
+  watchedSymbols() {
+    const symbols = new Set();
+    for (const client of this.clients) {
+      for (const symbol of client.symbols) symbols.add(symbol);
+    }
+    return [...symbols];
+  }
+
+  quotesFor(symbols) {
+    const quotes = {};
+    for (const symbol of symbols) {
+      if (this.snapshot.has(symbol)) quotes[symbol] = this.snapshot.get(symbol);
+    }
+    return quotes;
+  }
+
+  /**
+   * Poll upstream once (concurrent callers share the same poll) and
+   * broadcast the changed quotes. Resolves with the changed quotes.
+   */
+  poll() {
+    if (!this.polling) {
+      this.polling = this.pollOnce().finally(() => {
+        this.polling = null;
+      });
+    }
+    return this.polling;
+  }
+
+  async pollOnce() {
+    const symbols = this.watchedSymbols();
+    if (symbols.length === 0) return {};
+
+    this.metrics.polls++;
+    let quotes;
+    try {
+      quotes = await this.fetchPrices(symbols) || {};
+    } catch (error) {
+      this.metrics.failedPolls++;
+      logger.warn('[PriceStream] Poll failed', { error: error.message });
+      return {};
+    } finally {
+      // Clients may have left while the request was in flight
+      const watched = new Set(this.watchedSymbols());
+      for (const symbol of symbols) {
+        if (watched.has(symbol)) this.polled.add(symbol);
+      }
+    }
+
+    const changed = {};
+    for (const [symbol, quote] of Object.entries(quotes)) {
+      const key = symbol.toUpperCase();
+      if (!this.polled.has(key)) continue;
+      const previous = this.snapshot.get(key);
+      if (!previous || JSON.stringify(previous) !== JSON.stringify(quote)) {
+        this.snapshot.set(key, quote);
+        changed[key] = quote;
+      }
+    }
+
+    if (Object.keys(changed).length > 0) {
+      for (const client of this.clients) {
+        if (!client.ready) continue;
+        const update = this.quotesFor([...client.symbols].filter(symbol => symbol in changed));
+        if (Object.keys(update).length > 0) {
+          this.deliver(client, 'prices', update);
+        }
+      }
+    }
+    return changed;
+  }
+
+  deliver(client, event, data) {
+    try {
+      const result = client.send(event, data);
+      this.metrics.eventsSent++;
+      // Async senders (SSE writes) drop the client when the connection is gone
+      if (result && typeof result.catch === 'function') {
+        result.catch(() => this.unsubscribe(client));
+      }
+    } catch (error) {
+      this.unsubscribe(client);
+    }
+  }
+
+  getStats() {
+    return {
+      clients: this.clients.size,
+      symbols: this.watchedSymbols().length,
+      running: Boolean(this.timer),
+      ...this.metrics
+    };
+  }
+}
+
+module.exports = {
+  PriceStream
+};
@@ -0,0 +1,150 @@
+/**
+ * Section Aggregator
+ * Fan-out helper for composite routes such as /api/dashboard/comprehensive.
+ *
+ * Each section has its own loader and TTL. collect() starts every requested
+ * section concurrently, serves fresh cache entries without calling the
+ * loader, shares in-flight loads between concurrent requests, and stops
+ * waiting at a single deadline. A section that misses the deadline is
+ * reported as 'timeout' (or served 'stale' from an expired entry) while its
+ * load keeps running in the background and fills the cache for the next
+ * request.
+ */
+
+const DEFAULT_TIMEOUT_MS = 1500;
+const MAX_ENTRIES = 1000;
+const TIMED_OUT = Symbol('timed-out');
+
+/**
+ * 'portfolio, MARKET,foo' -> { names: ['portfolio', 'market'], unknown: ['foo'] }
+ * An empty query selects the default sections.
+ */
+function parseSections(query, known, defaults = known) {
+  if (!query || !String(query).trim()) {
+    return { names: [...defaults], unknown: [] };
+  }
+
+  const names = [];
+  const unknown = [];
+  for (const raw of String(query).split(',')) {
+    const name = raw.trim().toLowerCase();
+    if (!name) continue;
+    if (!known.includes(name)) {
+      unknown.push(name);
+    } else if (!names.includes(name)) {
+      names.push(name);
+    }
+  }
+  return { names, unknown };
+}
+
+/**
+ * sections: { name: { load: (ctx) => Promise, ttlMs, perUser } }
+ */
+function createSectionAggregator(sections, { timeoutMs = DEFAULT_TIMEOUT_MS, defaults } = {}) {
+  const known = Object.keys(sections);
+  const defaultNames = defaults || known;
+  const cache = new Map();    // cache key -> { value, at }
+  const inflight = new Map(); // cache key -> Promise
+
+  function cacheKey(name, ctx) {
+    return sections[name].perUser ? `${name}:${ctx.userId}` : name;
+  }
+
+  function store(key, value) {
+    cache.delete(key);
+    cache.set(key, { value, at: Date.now() });
+    if (cache.size > MAX_ENTRIES) {
+      cache.delete(cache.keys().next().value);
+    }
+  }
+
+  function load(name, key, ctx) {
+    let pending = inflight.get(key);
+    if (!pending) {
+      pending = Promise.resolve()
+        .then(() => sections[name].load(ctx))
+        .then(value => {
+          store(key, value);
+          return value;
+        })
+        .finally(() => inflight.delete(key));
+      // Failures are reported through collect(); late ones must not go unhandled
+      pending.catch(() => {});
+      inflight.set(key, pending);
+    }
+    return pending;
+  }
+
+  async function collectOne(name, ctx, deadline) {
+    const { ttlMs = 30000 } = sections[name];
+    const key = cacheKey(name, ctx);
+    const entry = cache.get(key);
+    const startedAt = Date.now();
+
+    if (entry && startedAt - entry.at < ttlMs) {
+      return { value: entry.value, meta: { status: 'cached', ageMs: startedAt - entry.at } };
+    }
+
+    const outcome = await Promise.race([
+      load(name, key, ctx).then(value => ({ value }), error => ({ error })),
+      deadline
+    ]);
+    const ms = Date.now() - startedAt;
+
+    if (outcome !== TIMED_OUT && !outcome.error) {
+      return { value: outcome.value, meta: { status: 'fresh', ms } };
+    }
+
+    const reason = outcome === TIMED_OUT ? 'timeout' : 'error';
+    const meta = { status: reason, ms };
+    if (outcome.error) {
+      meta.error = outcome.error.message;
+    }
+    if (entry) {
+      // Expired value beats no value
+      return { value: entry.value, meta: { ...meta, status: 'stale', reason, ageMs: Date.now() - entry.at } };
+    }
+    return { value: null, meta };
+  }
+
+  /**
+   * Resolve the requested sections (names array or `sections=` query string)
+   * within timeoutMs. Returns { data, sections, unknown, complete }.
+   */
+  async function collect(ctx = {}, requested) {
+    const { names, unknown } = Array.isArray(requested)
+      ? parseSections(requested.join(','), known, defaultNames)
+      : parseSections(requested, known, defaultNames);
+
+    let timer;
+    const deadline = new Promise(resolve => {
+      timer = setTimeout(() => resolve(TIMED_OUT), timeoutMs);
+    });
+
+    try {
+      const results = await Promise.all(names.map(name => collectOne(name, ctx, deadline)));
+      const data = {};
+      const meta = {};
+      names.forEach((name, i) => {
+        data[name] = results[i].value;
+        meta[name] = results[i].meta;
+      });
+      const complete = results.every(r => r.meta.status === 'fresh' || r.meta.status === 'cached');
+      return { data, sections: meta, unknown, complete };
+    } finally {
+      clearTimeout(timer);
+    }
+  }
+
+  return {
+    collect,
+    sectionNames: known,
+    clear: () => cache.clear()
+  };
+}
+
+module.exports = {
+  createSectionAggregator,
+  parseSections
+};
@@ -0,0 +1,81 @@
+/**
+ * Symbol Registry
+ * Bidirectional ticker symbol <-> CoinGecko id lookup for the market routes.
+ *
+ * Loaded once at startup from data/symbol-registry.json (generated by
+ * build_symbol_registry.py) into two Maps, so request handlers do O(1)
+ * lookups without rebuilding a symbol map per request.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const REGISTRY_FILE = process.env.SYMBOL_REGISTRY_FILE ||
+  path.join(__dirname, '..', 'data', 'symbol-registry.json');
+
+const bySymbol = new Map(); // 'BTC' -> 'bitcoin'
+const byId = new Map();     // 'bitcoin' -> { symbol: 'BTC', name: 'Bitcoin' }
+
+/**
+ * (Re)load the registry file, returns the number of symbols loaded
+ */
+function loadRegistry(file = REGISTRY_FILE) {
+  bySymbol.clear();
+  byId.clear();
+
+  try {
+    const raw = JSON.parse(fs.readFileSync(file, 'utf8'));
+    for (const [symbol, id] of Object.entries(raw.symbols || {})) {
+      bySymbol.set(symbol, id);
+    }
+    for (const [id, [symbol, name]] of Object.entries(raw.ids || {})) {
+      byId.set(id, { symbol, name });
+    }
+  } catch (error) {
+    console.warn(`Symbol registry not loaded (${error.message}), using raw ids`);
+  }
+
+  return bySymbol.size;
+}
+
+/**
+ * 'btc' / 'BTC' -> 'bitcoin'; unknown symbols are passed through lowercased
+ */
+function symbolToCoinId(symbol) {
+  const key = String(symbol).trim().toUpperCase();
+  return bySymbol.get(key) || key.toLowerCase();
+}
+
+/**
+ * True when the registry has the ticker (symbolToCoinId would not pass it through)
+ */
+function isKnownSymbol(symbol) {
+  return bySymbol.has(String(symbol).trim().toUpperCase());
+}
+
+/**
+ * 'bitcoin' -> 'BTC'; unknown ids keep their full id so they never collide
+ */
+function coinIdToSymbol(id) {
+  const entry = byId.get(id);
+  return entry ? entry.symbol : String(id).toUpperCase();
+}
+
+/**
+ * 'bitcoin' -> 'Bitcoin'
+ */
+function coinName(id) {
+  const entry = byId.get(id);
+  return entry ? entry.name : id.charAt(0).toUpperCase() + id.slice(1);
+}
+
+loadRegistry();
+
+module.exports = {
+  loadRegistry,
+  symbolToCoinId,
+  isKnownSymbol,
+  coinIdToSymbol,
+  coinName,
+  registrySize: () => bySymbol.size
+};